@@ -0,0 +1,345 @@
+"""
+Benchmarks for the engine hot paths, with a JSON run history.
+
+Every benchmark runs on fixed seeds, so two runs time exactly the same
+work. End-to-end games are timed per player count; the micro-benchmarks
+time single engine calls on a fixed set of mid-game positions, rebuilt
+(untimed) before each repeat when the call changes the game.
+
+    python benchmarks.py --label baseline      # record a baseline
+    python benchmarks.py --baseline baseline   # compare against it
+
+Each run is appended to the history file; the comparison flags every
+benchmark that got slower than the baseline by more than --threshold, and
+the exit status is 1 if any did.
+"""
+
+import argparse
+import copy
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+from cards import load_catalog
+from effects import (
+    EFFECT_DESTROY_1_SHIP,
+    EFFECT_DESTROY_1_SHIP_IGNORE_SHIELDS,
+    EFFECT_DESTROY_1_UNSHIELDED_SHIP,
+    EFFECT_STRIP_ALL_SHIELDS_ONE_OPPONENT,
+)
+from game import LOG_OFF, Game
+from simulation import game_seed, player_names_for
+
+BENCH_SEED = 20240601
+DEFAULT_HISTORY = "bench_history.json"
+
+GAMES_PER_RUN = 100      # end-to-end games per repeat, per player count
+POSITIONS = 1000         # mid-game positions for the micro-benchmarks
+POSITION_PLAYERS = 4
+HIT_EFFECTS = (
+    EFFECT_DESTROY_1_SHIP,
+    EFFECT_DESTROY_1_SHIP_IGNORE_SHIELDS,
+    EFFECT_DESTROY_1_UNSHIELDED_SHIP,
+    EFFECT_STRIP_ALL_SHIELDS_ONE_OPPONENT,
+)
+
+
+def _new_game(catalog, num_players, index):
+    return Game(
+        player_names_for(num_players), catalog.starter_deck, catalog.market_pile,
+        seed=game_seed(BENCH_SEED, index), log_level=LOG_OFF,
+    )
+
+
+def _positions(catalog):
+    """
+    (game, player) pairs at the start of `player`'s turn, a few rounds into
+    fixed-seed games. Rounds are played with play_turn directly, so the
+    positions don't depend on how Game.run ends a game.
+    """
+    positions = []
+    index = 0
+    while len(positions) < POSITIONS:
+        game = _new_game(catalog, POSITION_PLAYERS, index)
+        rounds = 1 + index % 12
+        index += 1
+        for _ in range(rounds):
+            game.turn_number += 1
+            for player in game.players:
+                if player.is_alive():
+                    player.skip_next_turn = False
+                    game.play_turn(player)
+        alive = [p for p in game.players if p.is_alive()]
+        if len(alive) >= 2:
+            positions.append((game, alive[index % len(alive)]))
+    return positions
+
+
+def _copy(objects, catalog):
+    """
+    Deep copy of `objects` (games, players) sharing the immutable catalog
+    Cards. Players hold no reference to their game, so copying just the
+    players is enough to rerun a call that only changes player state.
+    """
+    memo = {id(card): card for card in catalog.starter + catalog.abilities}
+    return copy.deepcopy(objects, memo)
+
+
+class Benchmark:
+    """
+    prepare() builds fresh state and returns a zero-argument callable that
+    does the timed work: `ops` operations per call.
+    """
+
+    def __init__(self, name, prepare, ops):
+        self.name = name
+        self.prepare = prepare
+        self.ops = ops
+
+
+def _game_run(catalog, num_players):
+    def prepare():
+        def run():
+            for i in range(GAMES_PER_RUN):
+                _new_game(catalog, num_players, i).run()
+        return run
+    return Benchmark(f"game_run_{num_players}p", prepare, GAMES_PER_RUN)
+
+
+def _game_setup(catalog):
+    # Game construction is deck setup: every starter deck and the market pile.
+    def prepare():
+        def run():
+            for i in range(GAMES_PER_RUN * 10):
+                _new_game(catalog, POSITION_PLAYERS, i)
+        return run
+    return Benchmark("game_setup", prepare, GAMES_PER_RUN * 10)
+
+
+def _draw_to_hand_size(catalog, positions):
+    def prepare():
+        players = _copy([player for _, player in positions], catalog)
+
+        def run():
+            for player in players:
+                player.draw_to_hand_size()
+        return run
+    return Benchmark("draw_to_hand_size", prepare, len(positions))
+
+
+def _bank_currency_from_hand(catalog, positions):
+    def prepare():
+        players = _copy([player for _, player in positions], catalog)
+        for player in players:
+            player.draw_to_hand_size()
+
+        def run():
+            for player in players:
+                player.bank_currency_from_hand()
+        return run
+    return Benchmark("bank_currency_from_hand", prepare, len(positions))
+
+
+def _choose_action(catalog, positions):
+    # Scores the hand left after the draw, bank and debris steps. The call is
+    # read-only, so one set of positions serves every repeat.
+    rounds = 3
+    decisions = _copy(positions, catalog)
+    for _, player in decisions:
+        player.draw_to_hand_size()
+        player.bank_currency_from_hand()
+        player.discard_debris_from_hand()
+
+    def prepare():
+        def run():
+            for _ in range(rounds):
+                for game, player in decisions:
+                    game._choose_action(player)
+        return run
+    return Benchmark("choose_action", prepare, rounds * len(decisions))
+
+
+def _estimate_hit_value(catalog, positions):
+    # Times the estimate itself: _estimate_hit_value would answer every round
+    # after the first from its per-decision cache.
+    rounds = 10
+    targets = [
+        (game, opp)
+        for game, player in positions
+        for opp in game._alive_opponents(player)
+    ]
+
+    def prepare():
+        def run():
+            for _ in range(rounds):
+                for game, opp in targets:
+                    for effect in HIT_EFFECTS:
+                        game._compute_hit_value(opp, effect)
+        return run
+    return Benchmark("estimate_hit_value", prepare, rounds * len(targets) * len(HIT_EFFECTS))
+
+
+def _fire_rocket(catalog, positions):
+    # Each shot hits a fresh copy of the target; the game itself only picks
+    # up hit counters and broken shields in its trash pile.
+    def prepare():
+        targets = _copy([game._alive_opponents(player)[0] for game, player in positions], catalog)
+        shots = [(game, player, target) for (game, player), target in zip(positions, targets)]
+
+        def run():
+            for game, attacker, target in shots:
+                game.fire_rocket(attacker, target, EFFECT_DESTROY_1_SHIP)
+        return run
+    return Benchmark("fire_rocket", prepare, len(positions))
+
+
+def all_benchmarks(catalog):
+    positions = _positions(catalog)
+    return [
+        *(_game_run(catalog, n) for n in range(2, 6)),
+        _game_setup(catalog),
+        _draw_to_hand_size(catalog, positions),
+        _bank_currency_from_hand(catalog, positions),
+        _choose_action(catalog, positions),
+        _estimate_hit_value(catalog, positions),
+        _fire_rocket(catalog, positions),
+    ]
+
+
+def measure(benchmark, repeats=7):
+    """Best time over `repeats`, in ns per operation (GC off while timing)."""
+    best = None
+    for _ in range(repeats):
+        run = benchmark.prepare()
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter_ns()
+            run()
+            elapsed = time.perf_counter_ns() - start
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        if best is None or elapsed < best:
+            best = elapsed
+    return best / benchmark.ops
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+def load_history(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+def save_history(path, history):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(history, f, indent=1)
+    os.replace(tmp_path, path)
+
+
+def find_baseline(history, label=None):
+    """Latest run with `label`, or the latest run at all when label is None."""
+    for run in reversed(history):
+        if label is None or run.get("label") == label:
+            return run
+    return None
+
+
+def compare(results, baseline, threshold):
+    """
+    Prints current vs baseline ns/op per benchmark.
+    Returns the names that are slower by more than `threshold` (a fraction).
+    """
+    previous = baseline["results"] if baseline else {}
+    regressions = []
+    print(f"{'benchmark':<26}{'ns/op':>14}{'baseline':>14}{'change':>9}")
+    for name, ns in results.items():
+        line = f"{name:<26}{ns:>14,.0f}"
+        old = previous.get(name)
+        if old:
+            change = ns / old - 1
+            line += f"{old:>14,.0f}{change * 100:>+8.1f}%"
+            if change > threshold:
+                line += "  REGRESSION"
+                regressions.append(name)
+        if name.startswith("game_run_"):
+            line += f"   ({1e9 / ns:,.0f} games/s)"
+        print(line)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the Space Goats engine hot paths.")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON run history (default: %(default)s)")
+    parser.add_argument("--label", help="tag this run in the history, e.g. 'baseline'")
+    parser.add_argument(
+        "--baseline",
+        help="compare against the latest run with this label (default: the previous run)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="slowdown that counts as a regression, as a fraction (default: %(default)s)",
+    )
+    parser.add_argument("--repeat", type=int, default=7, help="timed repeats per benchmark; the best counts")
+    parser.add_argument("--only", action="append", help="run only benchmarks whose name contains this")
+    parser.add_argument("--no-save", action="store_true", help="don't append this run to the history")
+    args = parser.parse_args(argv)
+
+    catalog = load_catalog()
+    benchmarks = all_benchmarks(catalog)
+    if args.only:
+        benchmarks = [b for b in benchmarks if any(part in b.name for part in args.only)]
+
+    results = {}
+    for benchmark in benchmarks:
+        results[benchmark.name] = measure(benchmark, args.repeat)
+
+    history = load_history(args.history)
+    baseline = find_baseline(history, args.baseline)
+    if args.baseline and baseline is None:
+        print(f"No run labelled {args.baseline!r} in {args.history}; nothing to compare against.")
+    elif baseline is not None:
+        print(f"Baseline: {baseline.get('label') or 'previous run'} ({baseline['time']}, {baseline.get('commit')})")
+    regressions = compare(results, baseline, args.threshold)
+
+    if not args.no_save:
+        history.append({
+            "time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "label": args.label,
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "repeat": args.repeat,
+            "results": results,
+        })
+        save_history(args.history, history)
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
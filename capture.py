@@ -0,0 +1,50 @@
+"""
+Which games of a batch run keep a full trace.
+
+Batch games run without a log. A CapturePolicy looks at each finished game
+and picks the interesting ones; only their seeds travel back from the
+workers, and run_simulation regenerates their traces by replaying them.
+
+Predicates are called as predicate(game, winner) on the finished game and
+must be module-level functions so they can be sent to pool workers.
+"""
+
+
+def hit_turn_limit(game, winner):
+    """Game ran into the max_turns cap with no winner decided by then."""
+    return game.hit_turn_limit
+
+
+def ended_in_draw(game, winner):
+    """Game ended in a Draw (bank tiebreak tied or nobody eligible)."""
+    return winner == "Draw"
+
+
+def won_by_last_seat(game, winner):
+    """Game was won by the player who moves last."""
+    return winner == game.players[-1].name
+
+
+class CapturePolicy:
+    """
+    Captures a game if any predicate matches it, or if it falls in the
+    `sample_rate` sample. Game seeds are uniform 64-bit hashes, so a game is
+    sampled when seed < sample_rate * 2**64: no RNG is drawn, and the same
+    games are sampled for any worker count or chunking.
+
+    `limit` caps the number of traces kept (the lowest game indexes win).
+    """
+
+    def __init__(self, *predicates, sample_rate=0.0, limit=100):
+        self.predicates = predicates
+        self.sample_rate = sample_rate
+        self.limit = limit
+
+    def reason(self, game, winner, seed):
+        """Name of the first matching predicate, "sampled", or None."""
+        for predicate in self.predicates:
+            if predicate(game, winner):
+                return predicate.__name__
+        if self.sample_rate and seed < self.sample_rate * 2**64:
+            return "sampled"
+        return None
@@ -1,31 +1,299 @@
-import pandas as pd
-import random
+import hashlib
+import json
+import math
+import os
+import time
 
+from effects import effect_code, intrinsic_value, is_supported, type_code
+from piles import CardPile
 
-def load_all_decks(filepath="data/Space_Goats_V1_Card_Deck2.xlsx"):
-    starter   = pd.read_excel(filepath, sheet_name="StarterDeck")
-    rockets   = pd.read_excel(filepath, sheet_name="RocketMarket")
-    shields   = pd.read_excel(filepath, sheet_name="ShieldMarket")
-    specials  = pd.read_excel(filepath, sheet_name="SpecialsMarket")
-    abilities = pd.concat([rockets, shields, specials], ignore_index=True)
+DEFAULT_WORKBOOK = "data/Space_Goats_V1_Card_Deck2.xlsx"
+STARTER_SHEET = "StarterDeck"
+MARKET_SHEETS = ("RocketMarket", "ShieldMarket", "SpecialsMarket")
+CATALOG_SHEETS = (STARTER_SHEET,) + MARKET_SHEETS
+SNAPSHOT_VERSION = 1
+
+
+def snapshot_path(filepath=DEFAULT_WORKBOOK):
+    """Catalog snapshot lives next to the workbook it was parsed from."""
+    return os.path.splitext(filepath)[0] + ".catalog.json"
+
+
+def _workbook_digest(filepath):
+    with open(filepath, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _parse_workbook(filepath):
+    # openpyxl (and its import cost) is only paid when the snapshot is stale.
+    from openpyxl import load_workbook
+
+    wb = load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        sheets = {}
+        for name in CATALOG_SHEETS:
+            rows = wb[name].iter_rows(values_only=True)
+            header = next(rows, ())
+            width = len(header)
+            while width and header[width - 1] is None:
+                width -= 1
+            sheets[name] = {
+                "columns": [str(c) for c in header[:width]],
+                "rows": [
+                    list(row[:width])
+                    for row in rows
+                    if any(value is not None for value in row[:width])
+                ],
+            }
+        return sheets
+    finally:
+        wb.close()
+
+
+def _read_snapshot(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+
+def _write_snapshot(path, snapshot):
+    # Write-then-rename so concurrent loaders never see a partial file.
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError:
+        # Read-only data directory: keep working from the parsed workbook.
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _load_sheets(filepath, use_snapshot):
+    """Returns (sheets, source) where source is "snapshot" or "workbook"."""
+    if not use_snapshot:
+        return _parse_workbook(filepath), "workbook"
+
+    stat = os.stat(filepath)
+    path = snapshot_path(filepath)
+    snapshot = _read_snapshot(path)
+    if snapshot is not None and (
+        snapshot.get("size") == stat.st_size and snapshot.get("mtime_ns") == stat.st_mtime_ns
+    ):
+        return snapshot["sheets"], "snapshot"
+
+    source = "snapshot"
+    digest = _workbook_digest(filepath)
+    if snapshot is None or snapshot.get("sha256") != digest:
+        snapshot = {"version": SNAPSHOT_VERSION, "sha256": digest, "sheets": _parse_workbook(filepath)}
+        source = "workbook"
+    snapshot["size"] = stat.st_size
+    snapshot["mtime_ns"] = stat.st_mtime_ns
+    _write_snapshot(path, snapshot)
+    return snapshot["sheets"], source
+
+
+def load_sheet_rows(filepath=DEFAULT_WORKBOOK, use_snapshot=True):
+    """
+    Returns {sheet_name: {"columns": [...], "rows": [[...], ...]}} for the
+    four catalog sheets.
+
+    The workbook is parsed once and cached in a snapshot file keyed on its
+    SHA-256. A matching size/mtime skips hashing; a changed mtime re-hashes
+    and only re-parses when the content actually changed.
+    """
+    return _load_sheets(filepath, use_snapshot)[0]
+
+
+def _sheet_records(sheet):
+    columns = sheet["columns"]
+    return [dict(zip(columns, row)) for row in sheet["rows"]]
+
+
+def _sheet_frame(sheet):
+    import pandas as pd
+
+    return pd.DataFrame(sheet["rows"], columns=sheet["columns"])
+
+
+def load_all_decks(filepath=DEFAULT_WORKBOOK):
+    """DataFrame view of the catalog sheets. Imports pandas on first use."""
+    import pandas as pd
+
+    sheets    = load_sheet_rows(filepath)
+    starter   = _sheet_frame(sheets[STARTER_SHEET])
+    abilities = pd.concat([_sheet_frame(sheets[name]) for name in MARKET_SHEETS], ignore_index=True)
     return starter, abilities
 
 
-def build_starter_deck(starter_df):
-    """Returns a shuffled 10-card personal deck for one player."""
-    deck = []
-    for _, row in starter_df.iterrows():
-        for _ in range(int(row["quantity"])):
-            deck.append(row.to_dict())
-    random.shuffle(deck)
-    return deck
-
-
-def build_market_pile(df):
-    """Expand a market sheet by 'copies', then shuffle. Top card = available."""
-    pile = []
-    for _, row in df.iterrows():
-        for _ in range(int(row["copies"])):
-            pile.append(row.to_dict())
-    random.shuffle(pile)
-    return pile
+def _clean_text(value):
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    return str(value)
+
+
+def _clean_int(value):
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return 0
+    return int(value)
+
+
+class Card:
+    """
+    One immutable catalog row. Every copy of a card in any deck, hand or pile
+    is a reference to the same Card, so per-game setup allocates no card data.
+    `value` (the AI's intrinsic card value, see effects.intrinsic_value) is
+    derived once here, so scoring reads it as a plain attribute.
+    """
+
+    __slots__ = (
+        "card_id", "name", "type", "effect", "notes",
+        "cost", "quantity", "copies", "type_code", "effect_code", "value",
+    )
+
+    def __init__(self, card_id, name, type, effect, notes="", cost=0, quantity=0, copies=0):
+        init = object.__setattr__
+        init(self, "card_id", card_id)
+        init(self, "name", name)
+        init(self, "type", type)
+        init(self, "effect", effect)
+        init(self, "notes", notes)
+        init(self, "cost", cost)
+        init(self, "quantity", quantity)
+        init(self, "copies", copies)
+        init(self, "type_code", type_code(type))
+        init(self, "effect_code", effect_code(effect))
+        init(self, "value", intrinsic_value(self.type_code, self.effect_code))
+
+    @classmethod
+    def from_row(cls, row):
+        """Build a Card from a workbook row dict (e.g. DataFrame.to_dict())."""
+        return cls(
+            card_id=_clean_text(row.get("card_id")),
+            name=_clean_text(row.get("name")),
+            type=_clean_text(row.get("type")),
+            effect=_clean_text(row.get("effect")),
+            notes=_clean_text(row.get("notes")),
+            cost=_clean_int(row.get("cost")),
+            quantity=_clean_int(row.get("quantity")),
+            copies=_clean_int(row.get("copies")),
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Card is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Card is immutable")
+
+    def __reduce__(self):
+        return (
+            Card,
+            (self.card_id, self.name, self.type, self.effect, self.notes,
+             self.cost, self.quantity, self.copies),
+        )
+
+    def __getitem__(self, key):
+        # Dict-style access for callers written against the old row dicts.
+        if key not in Card.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        if key not in Card.__slots__:
+            return default
+        return getattr(self, key)
+
+    def to_dict(self):
+        return {
+            "card_id": self.card_id,
+            "name": self.name,
+            "type": self.type,
+            "effect": self.effect,
+            "notes": self.notes,
+            "cost": self.cost,
+            "quantity": self.quantity,
+            "copies": self.copies,
+        }
+
+    def __repr__(self):
+        return f"Card({self.card_id} {self.name!r} {self.type}/{self.effect})"
+
+
+def compile_cards(rows):
+    """
+    Returns one shared Card per catalog row.
+    Accepts a DataFrame, an iterable of row dicts, or already-compiled Cards.
+    Raises ValueError for a card whose type/effect the engine can't resolve.
+    """
+    if hasattr(rows, "to_dict"):
+        rows = rows.to_dict("records")
+    cards = tuple(row if isinstance(row, Card) else Card.from_row(row) for row in rows)
+    for card in cards:
+        if not is_supported(card.type_code, card.effect_code):
+            raise ValueError(
+                f"card {card.card_id} {card.name!r}: no handler for {card.type!r} effect {card.effect!r}"
+            )
+    return cards
+
+
+class DeckTemplate(tuple):
+    """Flat card sequence already expanded by quantity/copies."""
+
+    __slots__ = ()
+
+
+def deck_template(source, count_field):
+    """
+    Expands catalog rows into a DeckTemplate, one entry per physical copy.
+    `count_field` is "quantity" (starter sheet) or "copies" (market sheets).
+    DeckTemplates are returned unchanged, so games only copy and shuffle.
+    """
+    if isinstance(source, DeckTemplate):
+        return source
+    return DeckTemplate(
+        card for card in compile_cards(source) for _ in range(getattr(card, count_field))
+    )
+
+
+class CardCatalog:
+    """Compiled starter and AbilitiesPile rows plus deck templates, built once per run."""
+
+    __slots__ = ("starter", "abilities", "starter_deck", "market_pile", "source", "load_seconds")
+
+    def __init__(self, starter, abilities, source="rows", load_seconds=0.0):
+        self.starter = compile_cards(starter)
+        self.abilities = compile_cards(abilities)
+        self.starter_deck = deck_template(self.starter, "quantity")
+        self.market_pile = deck_template(self.abilities, "copies")
+        self.source = source
+        self.load_seconds = load_seconds
+
+
+def load_catalog(filepath=DEFAULT_WORKBOOK, use_snapshot=True):
+    """
+    Compiled catalog without pandas: rows come from the snapshot, or from an
+    openpyxl read-only pass over the workbook when the snapshot is stale.
+    `source` and `load_seconds` on the result record which path was taken.
+    """
+    start = time.perf_counter()
+    sheets, source = _load_sheets(filepath, use_snapshot)
+    starter = _sheet_records(sheets[STARTER_SHEET])
+    abilities = [row for name in MARKET_SHEETS for row in _sheet_records(sheets[name])]
+    return CardCatalog(starter, abilities, source, time.perf_counter() - start)
+
+
+def build_starter_deck(starter, rng=None):
+    """Returns a (lazily) shuffled 10-card personal deck for one player."""
+    return CardPile(deck_template(starter, "quantity"), shuffled=True, rng=rng)
+
+
+def build_market_pile(abilities, rng=None):
+    """Expand a market sheet by 'copies', then shuffle lazily. Top card = available."""
+    return CardPile(deck_template(abilities, "copies"), shuffled=True, rng=rng)
@@ -0,0 +1,85 @@
+"""
+Precomputed rocket-hit outcomes.
+
+Where the defender lands a rocket, and what the hit does there, depend only
+on the rocket's effect and on which kinds of ship the defending fleet holds.
+Fleet.composition packs the latter into the HAS_* bits below, and
+COMBAT_TABLE[effect][composition] is the (landing, outcome) pair for it,
+built once at import from the rules in RULES.md:
+
+- assigned shields absorb hits first, weakest first; a weak rocket
+  (destroy_1_unshielded_ship) landing on one is stopped outright;
+- a piercing rocket (destroy_1_ship_ignore_shields) passes through every
+  assigned shield except assign_to_ship_block_any, so the defender puts it
+  on a block_any shield, then on the starter shielded side, then on the
+  ship that is least costly to lose;
+- a ship on the starter shielded side flips instead of being destroyed.
+
+Last stand is not part of the table: it is per player, and only matters
+once the outcome is HIT_DESTROYED.
+"""
+
+from effects import EFFECT_DESTROY_1_SHIP_IGNORE_SHIELDS, EFFECT_DESTROY_1_UNSHIELDED_SHIP, NUM_EFFECTS
+
+# Fleet composition bits, each set while the fleet has at least one such ship.
+HAS_SHIELDED = 1          # carries an assigned shield
+HAS_BLOCK_ANY = 2         # carries an assign_to_ship_block_any shield
+HAS_STARTER_BARE = 4      # on the starter shielded side, no assigned shield
+HAS_STARTER_SHIELDED = 8  # on the starter shielded side
+HAS_BARE = 16             # neither an assigned shield nor the starter side
+NUM_COMPOSITIONS = 32
+
+# Ship the defender lands the rocket on (first such ship in fleet order).
+LAND_WEAKEST_SHIELD = 0      # lowest-HP assigned shield
+LAND_WEAKEST_BLOCK_ANY = 1   # lowest-HP assign_to_ship_block_any shield
+LAND_STARTER_BARE = 2
+LAND_STARTER = 3
+LAND_BARE = 4
+LAND_FIRST = 5               # empty fleet; never reached for a live target
+
+# What the hit does to that ship.
+HIT_BLOCKED = 0     # weak rocket stopped by an assigned shield; nothing changes
+HIT_ABSORBED = 1    # the assigned shield loses 1 HP
+HIT_FLIPPED = 2     # the ship flips to its starter unshielded side
+HIT_DESTROYED = 3   # the ship is lost, unless last stand saves it
+
+
+def _resolve(composition, effect):
+    """(landing, outcome) for one composition, straight from the rules."""
+    if effect == EFFECT_DESTROY_1_SHIP_IGNORE_SHIELDS:
+        if composition & HAS_BLOCK_ANY:
+            return LAND_WEAKEST_BLOCK_ANY, HIT_ABSORBED
+        if composition & HAS_STARTER_BARE:
+            return LAND_STARTER_BARE, HIT_FLIPPED
+        # The ship's assigned shield isn't block_any, so the starter side takes it.
+        if composition & HAS_STARTER_SHIELDED:
+            return LAND_STARTER, HIT_FLIPPED
+        if composition & HAS_BARE:
+            return LAND_BARE, HIT_DESTROYED
+        if composition & HAS_SHIELDED:
+            return LAND_WEAKEST_SHIELD, HIT_DESTROYED
+        return LAND_FIRST, HIT_DESTROYED
+
+    if composition & HAS_SHIELDED:
+        if effect == EFFECT_DESTROY_1_UNSHIELDED_SHIP:
+            return LAND_WEAKEST_SHIELD, HIT_BLOCKED
+        return LAND_WEAKEST_SHIELD, HIT_ABSORBED
+    if composition & HAS_STARTER_BARE:
+        return LAND_STARTER_BARE, HIT_FLIPPED
+    if composition & HAS_BARE:
+        return LAND_BARE, HIT_DESTROYED
+    return LAND_FIRST, HIT_DESTROYED
+
+
+def build_combat_table():
+    """COMBAT_TABLE rows: one tuple of (landing, outcome) per effect code."""
+    rows = {}
+    table = []
+    for effect in range(NUM_EFFECTS):
+        row = tuple(_resolve(composition, effect) for composition in range(NUM_COMPOSITIONS))
+        # Effects that resolve alike share one row.
+        table.append(rows.setdefault(row, row))
+    return table
+
+
+COMBAT_TABLE = build_combat_table()
@@ -0,0 +1,180 @@
+"""
+Interned card type and effect codes.
+
+Workbook rows spell types and effects as strings. The engine compares the
+small integer codes below instead, so every string is resolved once when a
+catalog row is compiled into a Card.
+"""
+
+TYPE_UNKNOWN = 0
+TYPE_CURRENCY = 1
+TYPE_DEBRIS = 2
+TYPE_ROCKET = 3
+TYPE_SHIELD = 4
+TYPE_SPECIAL = 5
+NUM_CARD_TYPES = 6
+
+TYPE_NAMES = ("unknown", "currency", "debris", "rocket", "shield", "special")
+TYPE_CODES = {name: code for code, name in enumerate(TYPE_NAMES) if code != TYPE_UNKNOWN}
+
+EFFECT_UNKNOWN = 0
+EFFECT_NO_EFFECT = 1
+EFFECT_GAIN_1_CURRENCY = 2
+EFFECT_GAIN_1_CURRENCY_DRAW_1 = 3
+
+# Rockets
+EFFECT_DESTROY_1_SHIP = 4
+EFFECT_DESTROY_1_UNSHIELDED_SHIP = 5
+EFFECT_DESTROY_1_WEAKEST_SHIP = 6
+EFFECT_DESTROY_1_SHIP_IGNORE_SHIELDS = 7
+EFFECT_STRIP_ALL_SHIELDS_ONE_OPPONENT = 8
+EFFECT_EACH_OPPONENT_BLOCKS_OR_LOSES_SHIP = 9
+EFFECT_DESTROY_UP_TO_2_SHIPS = 10
+EFFECT_DESTROY_UP_TO_2_SHIPS_THEN_LOSE_1_BANK = 11
+EFFECT_DESTROY_1_SHIP_THEN_DISCARD_1_RANDOM = 12
+EFFECT_EACH_OPPONENT_BLOCKS_2_AND_SKIP = 13
+EFFECT_SKIP_NEXT_TURN = 14
+EFFECT_SKIP_NEXT_BUY = 15
+
+# Shields
+EFFECT_ASSIGN_BLOCK_1 = 16
+EFFECT_ASSIGN_BLOCK_1_DRAW_1_DISCARD_1 = 17
+EFFECT_ASSIGN_BLOCK_2 = 18
+EFFECT_ASSIGN_BLOCK_ANY = 19
+EFFECT_REACTIVE_BLOCK_1_ROCKET = 20
+EFFECT_REACTIVE_BLOCK_THEN_TRASH_1 = 21
+EFFECT_CANCEL_1_ROCKET = 22
+
+# Specials
+EFFECT_DRAW_3_KEEP_2_DISCARD_1 = 23
+EFFECT_RETRIEVE_1_FROM_DISCARD = 24
+EFFECT_LOOK_AT_TOP3_REARRANGE = 25
+EFFECT_NEGATE_LAST_SHIP_LOSS = 26
+EFFECT_ADD_1_SHIP_TO_FLEET = 27
+EFFECT_TAKE_EXTRA_TURN = 28
+EFFECT_TRASH_1_FROM_DISCARD = 29
+EFFECT_TRASH_1_FROM_DISCARD_DRAW_1 = 30
+
+NUM_EFFECTS = 31
+
+# Canonical workbook spelling for each code.
+EFFECT_NAMES = (
+    "unknown",
+    "no_effect",
+    "gain_1_currency",
+    "gain_1_currency_draw_1",
+    "destroy_1_ship",
+    "destroy_1_unshielded_ship",
+    "destroy_1_weakest_ship",
+    "destroy_1_ship_ignore_shields",
+    "strip_all_shields_one_opponent",
+    "each_opponent_blocks_or_loses_ship",
+    "destroy_up_to_2_ships",
+    "destroy_up_to_2_ships_then_lose_one_1_bank_currency",
+    "destroy_1_ship_then_discard_1_random_card_from_hand",
+    "each_opponent_blocks_2_or_loses_2_ships_and_you_skip_next_turn",
+    "skip_next_turn",
+    "skip_next_buy",
+    "assign_to_ship_block_1",
+    "assign_to_ship_block_1_draw_1_discard_1",
+    "assign_to_ship_block_2",
+    "assign_to_ship_block_any",
+    "reactive_block_1_rocket",
+    "reactive_block_1_rocket_then_trash_1_card_from_hand_or_discard",
+    "cancel_1_rocket_targeting_you",
+    "draw_3_keep_2_discard_1",
+    "retrieve_1_card_from_discard",
+    "look_at_top3_any_market_rearrange",
+    "negate_last_ship_loss_once",
+    "add_1_ship_to_fleet",
+    "take_extra_turn",
+    "trash_1_card_from_discard",
+    "trash_1_card_from_discard_draw_1",
+)
+
+EFFECT_CODES = {name: code for code, name in enumerate(EFFECT_NAMES) if code != EFFECT_UNKNOWN}
+# Legacy workbook spellings resolve to the same codes.
+EFFECT_CODES["destory_up_to_2_ships"] = EFFECT_DESTROY_UP_TO_2_SHIPS
+EFFECT_CODES[
+    "reactive_block_1_rocket_then_trash_1_card_from_hand_or_discards"
+] = EFFECT_REACTIVE_BLOCK_THEN_TRASH_1
+
+REACTIVE_BLOCK_EFFECTS = frozenset((
+    EFFECT_REACTIVE_BLOCK_1_ROCKET,
+    EFFECT_REACTIVE_BLOCK_THEN_TRASH_1,
+    EFFECT_CANCEL_1_ROCKET,
+))
+
+ASSIGN_SHIELD_EFFECTS = frozenset((
+    EFFECT_ASSIGN_BLOCK_1,
+    EFFECT_ASSIGN_BLOCK_1_DRAW_1_DISCARD_1,
+    EFFECT_ASSIGN_BLOCK_2,
+    EFFECT_ASSIGN_BLOCK_ANY,
+))
+
+# Effects the engine resolves, per card type. compile_cards rejects any
+# other pairing (including unrecognised effect strings) when a catalog loads.
+CARD_EFFECTS = {
+    TYPE_CURRENCY: frozenset((EFFECT_GAIN_1_CURRENCY, EFFECT_GAIN_1_CURRENCY_DRAW_1)),
+    TYPE_DEBRIS: frozenset((EFFECT_NO_EFFECT,)),
+    TYPE_ROCKET: frozenset(range(EFFECT_DESTROY_1_SHIP, EFFECT_SKIP_NEXT_BUY + 1)),
+    TYPE_SHIELD: frozenset(range(EFFECT_ASSIGN_BLOCK_1, EFFECT_CANCEL_1_ROCKET + 1)),
+    TYPE_SPECIAL: frozenset(
+        range(EFFECT_DRAW_3_KEEP_2_DISCARD_1, EFFECT_TRASH_1_FROM_DISCARD_DRAW_1 + 1)
+    ) | {EFFECT_SKIP_NEXT_TURN, EFFECT_SKIP_NEXT_BUY},
+}
+
+# Intrinsic card values for the AI (buy scoring, trash/discard picks):
+# a per-type base, overridden for specific effects.
+TYPE_BASE_VALUES = (0.0, 2.0, -4.0, 7.5, 5.5, 5.0)
+EFFECT_VALUES = {
+    TYPE_ROCKET: {
+        EFFECT_DESTROY_1_SHIP: 8.0,
+        EFFECT_DESTROY_1_SHIP_THEN_DISCARD_1_RANDOM: 7.4,
+        EFFECT_DESTROY_1_WEAKEST_SHIP: 8.5,
+        EFFECT_DESTROY_1_SHIP_IGNORE_SHIELDS: 9.2,
+        EFFECT_STRIP_ALL_SHIELDS_ONE_OPPONENT: 7.8,
+        EFFECT_EACH_OPPONENT_BLOCKS_OR_LOSES_SHIP: 10.0,
+        EFFECT_DESTROY_UP_TO_2_SHIPS: 10.5,
+        EFFECT_DESTROY_UP_TO_2_SHIPS_THEN_LOSE_1_BANK: 9.3,
+        EFFECT_DESTROY_1_UNSHIELDED_SHIP: 6.0,
+        EFFECT_SKIP_NEXT_TURN: 4.8,
+        EFFECT_SKIP_NEXT_BUY: 4.8,
+        EFFECT_EACH_OPPONENT_BLOCKS_2_AND_SKIP: 11.2,
+    },
+    TYPE_SHIELD: {
+        EFFECT_ASSIGN_BLOCK_1: 6.2,
+        EFFECT_ASSIGN_BLOCK_1_DRAW_1_DISCARD_1: 6.8,
+        EFFECT_ASSIGN_BLOCK_2: 8.2,
+        EFFECT_ASSIGN_BLOCK_ANY: 9.0,
+        EFFECT_REACTIVE_BLOCK_1_ROCKET: 7.0,
+        EFFECT_REACTIVE_BLOCK_THEN_TRASH_1: 7.6,
+        EFFECT_CANCEL_1_ROCKET: 7.0,
+    },
+    TYPE_SPECIAL: {
+        EFFECT_DRAW_3_KEEP_2_DISCARD_1: 6.5,
+        EFFECT_RETRIEVE_1_FROM_DISCARD: 7.0,
+        EFFECT_LOOK_AT_TOP3_REARRANGE: 5.0,
+        EFFECT_NEGATE_LAST_SHIP_LOSS: 7.5,
+        EFFECT_ADD_1_SHIP_TO_FLEET: 8.2,
+        EFFECT_TAKE_EXTRA_TURN: 9.8,
+        EFFECT_SKIP_NEXT_TURN: 1.0,
+        EFFECT_SKIP_NEXT_BUY: 1.0,
+    },
+}
+
+
+def is_supported(type_code, effect_code):
+    return effect_code in CARD_EFFECTS.get(type_code, ())
+
+
+def intrinsic_value(type_code, effect_code):
+    return EFFECT_VALUES.get(type_code, {}).get(effect_code, TYPE_BASE_VALUES[type_code])
+
+
+def type_code(name):
+    return TYPE_CODES.get(str(name).strip(), TYPE_UNKNOWN)
+
+
+def effect_code(name):
+    return EFFECT_CODES.get(str(name).strip(), EFFECT_UNKNOWN)
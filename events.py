@@ -0,0 +1,422 @@
+"""
+Game event stream.
+
+Game records what happens as compact tuples, (kind, *fields), where kind is
+one of the EVENT_* codes below, players are seat indexes into game.players
+and cards are the shared catalog Card objects. Subscribers get the tuples
+as they happen; game.events keeps them packed in an EventLog. Log text is
+only produced on request, by render_event().
+"""
+
+from array import array
+
+from effects import (
+    EFFECT_ADD_1_SHIP_TO_FLEET,
+    EFFECT_DRAW_3_KEEP_2_DISCARD_1,
+    EFFECT_LOOK_AT_TOP3_REARRANGE,
+    EFFECT_NEGATE_LAST_SHIP_LOSS,
+    EFFECT_RETRIEVE_1_FROM_DISCARD,
+    EFFECT_SKIP_NEXT_BUY,
+    EFFECT_SKIP_NEXT_TURN,
+    EFFECT_TAKE_EXTRA_TURN,
+    EFFECT_TRASH_1_FROM_DISCARD,
+    EFFECT_TRASH_1_FROM_DISCARD_DRAW_1,
+)
+
+# Game flow
+EVENT_GAME_START = 1             # ()
+EVENT_ROSTER = 2                 # (seat, ships, shielded, hand, bank, deck, discard)
+EVENT_TURN_START = 3             # (turn_number,)
+EVENT_SKIP_TURN = 4              # (seat,)
+EVENT_EXTRA_TURN = 5             # (seat,)
+EVENT_EXTRA_TURN_LOST = 6        # (seat,)
+EVENT_WINNER = 7                 # (seat, turn_number)
+EVENT_MUTUAL_DESTRUCTION = 8     # (turn_number,)
+EVENT_TURN_LIMIT = 9             # (max_turns, seat, ships)
+EVENT_TURN_LIMIT_NO_PLAYERS = 10  # (max_turns,)
+EVENT_DRAW_NO_CANDIDATES = 11    # ()
+EVENT_BANK_TIEBREAK = 12         # (seat, bank)
+EVENT_DRAW_TIED = 13             # (bank, seats)
+EVENT_WRECKAGE = 14              # ()
+EVENT_WRECKAGE_HIT = 15          # (seat,)
+
+# Turn steps
+EVENT_DRAW = 16                  # (seat, hand, deck, discard, bank)
+EVENT_BANK = 17                  # (seat, banked, bank, scout_draws)
+EVENT_DEBRIS = 18                # (seat, discarded)
+EVENT_MARKET = 19                # (cards,) market display, None for empty slots
+EVENT_CHOOSE_BUY = 20            # (seat, card, score)
+EVENT_CHOOSE_ROCKET = 21         # (seat, card, score)
+EVENT_CHOOSE_SHIELD = 22         # (seat, card, score)
+EVENT_CHOOSE_SPECIAL = 23        # (seat, card, score)
+EVENT_PASS = 24                  # (seat,)
+EVENT_BUY = 25                   # (seat, card, cost, spent_bank, spent_hand, bank_left, deployed)
+
+# Rockets
+EVENT_FIRE = 26                  # (seat, card, target_seat)
+EVENT_FIRE_ALL = 27              # (seat, card)
+EVENT_FIRE_SALVO = 28            # (seat, card)
+EVENT_FIRE_SALVO_PLUS = 29       # (seat, card)
+EVENT_FIRE_OVERLOAD = 30         # (seat, card)
+EVENT_FIRE_EMP = 31              # (seat, target_seat)
+EVENT_FORCE_SKIP = 32            # (seat, target_seat)
+EVENT_SALVO_DRAWBACK = 33        # (seat, lost_bank)
+EVENT_OVERLOAD_DRAWBACK = 34     # (seat,)
+EVENT_SHATTER_DRAWBACK = 35      # (seat, discarded_card or None)
+EVENT_SHIELDS_STRIPPED = 36      # (target_seat, ships)
+
+# Rocket impacts
+EVENT_REACTIVE_BLOCK = 37        # (target_seat, card)
+EVENT_AEGIS_TRASH = 38           # (target_seat, card or None, zone)
+EVENT_IMPACT = 39                # (target_seat, impact_zone)
+EVENT_WEAK_ROCKET_BLOCKED = 40   # (target_seat,)
+EVENT_SHIELD_ABSORB = 41         # (target_seat, shield_hp)
+EVENT_SHIELD_DESTROYED = 42      # (target_seat, ships, trashed)
+EVENT_STARTER_FLIP = 43          # (target_seat,)
+EVENT_LAST_STAND_SAVE = 44       # (target_seat,)
+EVENT_SHIP_LOST = 45             # (target_seat, ships)
+
+# Shields and specials
+EVENT_ASSIGN_SHIELD = 46         # (seat, card, shielded, ships)
+EVENT_DECOY_RESOLVE = 47         # (seat, drew, discarded_card or None)
+EVENT_SHIELD_DISCARDED = 48      # (seat, card)
+EVENT_SPECIAL = 49               # (seat, card, other_card or None, extra)
+
+NUM_EVENTS = 50
+
+# EventLog word layout; see EventLog.
+_INLINE_MAX = 32767
+_HEAD_NO_FIRST = 63      # head carries no first field
+_MAX_FIELDS = 7
+
+# Reference tags, the low two bits of an EventLog reference.
+_REF_OBJECT = 0
+_REF_FLOAT = 1
+_REF_TUPLE = 2
+
+# Distinct non-int, non-float field values (Cards, None, bools, strs), kept
+# once for all games in the process: events only ever carry catalog Cards
+# and constants, so the table stays small however many games run.
+_objects = []
+_object_refs = {}
+
+
+class EventLog:
+    """
+    A game's events packed into one flat array of 16-bit words: per event,
+    a head word (kind | field count << 6 | first << 9; at most 7 fields),
+    then the fields.
+    A first field that is an int below _HEAD_NO_FIRST (usually a seat)
+    rides in the head; otherwise `first` is _HEAD_NO_FIRST and the field
+    follows like the rest. Non-negative ints up to _INLINE_MAX are stored
+    as themselves; any other field is a
+    negative word, -1 - ref, whose low two bits say what ref points at:
+      _REF_OBJECT  an entry of the process-wide object table (ref >> 2)
+      _REF_FLOAT   an entry of this log's float array, e.g. action scores
+      _REF_TUPLE   a tuple of ref >> 2 fields, encoded in the words after it
+    The array widens to 32-bit words if a game ever needs more references
+    than fit. Iterating decodes the events back into the tuples Game emitted.
+    Object references only mean something in the process that wrote them,
+    so a pickled log carries the decoded events and packs them again on load.
+    """
+
+    __slots__ = ("_words", "_floats", "_count")
+
+    def __init__(self):
+        self._words = array("h")
+        self._floats = array("d")
+        self._count = 0
+
+    def _put(self, value):
+        if type(value) is int and 0 <= value <= _INLINE_MAX:
+            self._words.append(value)
+            return
+        if type(value) is tuple:
+            self._put_ref(len(value) << 2 | _REF_TUPLE)
+            for item in value:
+                self._put(item)
+        elif type(value) is float:
+            self._floats.append(value)
+            self._put_ref((len(self._floats) - 1) << 2 | _REF_FLOAT)
+        else:
+            index = _object_refs.get(value)
+            if index is None:
+                index = _object_refs[value] = len(_objects)
+                _objects.append(value)
+            self._put_ref(index << 2 | _REF_OBJECT)
+
+    def _put_ref(self, ref):
+        if ref > _INLINE_MAX and self._words.typecode == "h":
+            self._words = array("i", self._words)
+        self._words.append(-1 - ref)
+
+    def append(self, event):
+        if len(event) > _MAX_FIELDS + 1:
+            raise ValueError(f"event {event[0]} has more than {_MAX_FIELDS} fields")
+        head = event[0] | (len(event) - 1) << 6
+        fields = event[1:]
+        if fields and type(fields[0]) is int and 0 <= fields[0] < _HEAD_NO_FIRST:
+            head |= fields[0] << 9
+            fields = fields[1:]
+        else:
+            head |= _HEAD_NO_FIRST << 9
+        words = self._words
+        words.append(head)
+        for value in fields:
+            if type(value) is int and 0 <= value <= _INLINE_MAX:
+                words.append(value)
+            else:
+                self._put(value)
+                # _put may have swapped in a wider array.
+                words = self._words
+        self._count += 1
+
+    def _get(self, i):
+        """(value, index of the next word) for the field at word i."""
+        word = self._words[i]
+        if word >= 0:
+            return word, i + 1
+        ref = -1 - word
+        tag = ref & 3
+        if tag == _REF_OBJECT:
+            return _objects[ref >> 2], i + 1
+        if tag == _REF_FLOAT:
+            return self._floats[ref >> 2], i + 1
+        items = []
+        i += 1
+        for _ in range(ref >> 2):
+            item, i = self._get(i)
+            items.append(item)
+        return tuple(items), i
+
+    def __iter__(self):
+        words = self._words
+        i = 0
+        end = len(words)
+        while i < end:
+            head = words[i]
+            event = [head & 63]
+            fields = head >> 6 & 7
+            first = head >> 9
+            if first != _HEAD_NO_FIRST:
+                event.append(first)
+                fields -= 1
+            i += 1
+            for _ in range(fields):
+                value, i = self._get(i)
+                event.append(value)
+            yield tuple(event)
+
+    def __len__(self):
+        return self._count
+
+    def __reduce__(self):
+        return _load_event_log, (list(self),)
+
+    @property
+    def nbytes(self):
+        """Bytes held by this log's buffers (the shared object table aside)."""
+        return self._words.itemsize * len(self._words) + self._floats.itemsize * len(self._floats)
+
+    def __repr__(self):
+        return f"EventLog({self._count} events, {self.nbytes} bytes)"
+
+
+def _load_event_log(events):
+    log = EventLog()
+    for event in events:
+        log.append(event)
+    return log
+
+
+def _market_text(cards):
+    slots = []
+    for i, card in enumerate(cards, start=1):
+        if card is None:
+            slots.append(f"{i}: empty")
+        else:
+            slots.append(f"{i}: {card.name} (${card.cost})")
+    return " | ".join(slots)
+
+
+def _special_text(name, card, other, extra):
+    effect = card.effect_code
+    if effect == EFFECT_DRAW_3_KEEP_2_DISCARD_1:
+        return f"  {name} plays 'Deep Space Recon' (drew 3, kept 2)"
+    if effect == EFFECT_RETRIEVE_1_FROM_DISCARD:
+        if other is None:
+            return f"  {name} plays 'Salvage Operation' (discard empty)"
+        return f"  {name} plays 'Salvage Operation' - retrieves '{other.name}'"
+    if effect == EFFECT_NEGATE_LAST_SHIP_LOSS:
+        return f"  {name} plays 'Last Stand Protocol' - final ship protected!"
+    if effect == EFFECT_ADD_1_SHIP_TO_FLEET:
+        return (
+            f"  {name} plays 'Reinforcement Shuttle' from hand (legacy) - "
+            f"fleet grows to {extra} ships!"
+        )
+    if effect == EFFECT_TAKE_EXTRA_TURN:
+        return f"  {name} plays 'Warp Drive' - extra turn queued!"
+    if effect == EFFECT_LOOK_AT_TOP3_REARRANGE:
+        return f"  {name} plays 'Arms Dealer' - rearranged market deck"
+    if effect == EFFECT_TRASH_1_FROM_DISCARD:
+        if other is None:
+            return f"  {name} plays 'Deck Purge' (no cards to trash)"
+        return f"  {name} plays 'Deck Purge' - trashes '{other.name}' from {extra}"
+    if effect == EFFECT_TRASH_1_FROM_DISCARD_DRAW_1:
+        if other is None:
+            return f"  {name} plays 'Deep Clean' (discard empty, draws 1)"
+        return f"  {name} plays 'Deep Clean' - trashes '{other.name}' and draws 1"
+    if effect in (EFFECT_SKIP_NEXT_TURN, EFFECT_SKIP_NEXT_BUY):
+        return f"  {name} applies a skip effect and will skip their next turn"
+    return f"  {name} plays '{card.name}' (no effect handler)"
+
+
+def render_event(event, names):
+    """One log line for `event`; `names` maps seat index to player name."""
+    kind = event[0]
+
+    if kind == EVENT_GAME_START:
+        return "=== Game Start ==="
+    if kind == EVENT_ROSTER:
+        _, seat, ships, shielded, hand, bank, deck, discard = event
+        return (
+            f"  {names[seat]} | Ships:{ships}({shielded} shielded) "
+            f"| Hand:{hand} | Bank:{bank} "
+            f"| Deck:{deck} Discard:{discard}"
+        )
+    if kind == EVENT_TURN_START:
+        return f"\n-- Turn {event[1]} --"
+    if kind == EVENT_SKIP_TURN:
+        return f"  {names[event[1]]} skips this turn."
+    if kind == EVENT_EXTRA_TURN:
+        return f"  * {names[event[1]]} takes an extra turn (Warp Drive)!"
+    if kind == EVENT_EXTRA_TURN_LOST:
+        return f"  * {names[event[1]]} loses their extra turn (skip_next_turn)."
+    if kind == EVENT_WINNER:
+        return f"\nWinner: {names[event[1]]} on turn {event[2]}."
+    if kind == EVENT_MUTUAL_DESTRUCTION:
+        return f"\nMutual destruction on turn {event[1]}."
+    if kind == EVENT_TURN_LIMIT:
+        _, max_turns, seat, ships = event
+        return f"\nTurn limit reached ({max_turns}). {names[seat]} wins with {ships} ships."
+    if kind == EVENT_TURN_LIMIT_NO_PLAYERS:
+        return f"\nNo players alive at turn limit ({event[1]})."
+    if kind == EVENT_DRAW_NO_CANDIDATES:
+        return "\nDraw: no eligible players for bank tiebreak."
+    if kind == EVENT_BANK_TIEBREAK:
+        return f"\nBank tiebreak: {names[event[1]]} wins with {event[2]} bank currency."
+    if kind == EVENT_DRAW_TIED:
+        _, bank, seats = event
+        return (
+            f"\nDraw: bank tiebreak tied at {bank} currency among "
+            f"{', '.join(names[seat] for seat in seats)}."
+        )
+    if kind == EVENT_WRECKAGE:
+        return (
+            "  !! Unavoidable Ship Wreckage: no ships were destroyed this round, "
+            "each duelist suffers 1 unavoidable hit."
+        )
+    if kind == EVENT_WRECKAGE_HIT:
+        return f"    -> {names[event[1]]} must take 1 wreckage hit."
+
+    if kind == EVENT_DRAW:
+        _, seat, hand, deck, discard, bank = event
+        return f"  {names[seat]} draws to {hand} cards (deck:{deck} discard:{discard} bank:{bank})"
+    if kind == EVENT_BANK:
+        _, seat, banked, bank, scout_draws = event
+        draw_note = f" | scout draws: {scout_draws}" if scout_draws else ""
+        return f"  {names[seat]} banks {banked} currency card(s) [bank: {bank}{draw_note}]"
+    if kind == EVENT_DEBRIS:
+        return f"  {names[event[1]]} discards {event[2]} debris card(s)"
+    if kind == EVENT_MARKET:
+        return f"  Market: {_market_text(event[1])}"
+    if kind == EVENT_CHOOSE_BUY:
+        return f"  {names[event[1]]} chooses BUY '{event[2].name}' (score {event[3]:.1f})"
+    if kind == EVENT_CHOOSE_ROCKET:
+        return f"  {names[event[1]]} chooses ROCKET '{event[2].name}' (score {event[3]:.1f})"
+    if kind == EVENT_CHOOSE_SHIELD:
+        return f"  {names[event[1]]} chooses SHIELD '{event[2].name}' (score {event[3]:.1f})"
+    if kind == EVENT_CHOOSE_SPECIAL:
+        return f"  {names[event[1]]} chooses SPECIAL '{event[2].name}' (score {event[3]:.1f})"
+    if kind == EVENT_PASS:
+        return f"  {names[event[1]]} passes (no valid action)"
+    if kind == EVENT_BUY:
+        _, seat, card, cost, spent_bank, spent_hand, bank_left, deployed = event
+        destination_note = "deployed to fleet (unshielded)" if deployed else "to discard"
+        return (
+            f"  {names[seat]} buys '{card.name}' (cost {cost}) "
+            f"[spent bank:{spent_bank}, hand:{spent_hand}, bank left:{bank_left}; {destination_note}]"
+        )
+
+    if kind == EVENT_FIRE:
+        return f"  {names[event[1]]} fires '{event[2].name}' at {names[event[3]]}"
+    if kind == EVENT_FIRE_ALL:
+        return f"  {names[event[1]]} fires '{event[2].name}' at ALL opponents!"
+    if kind == EVENT_FIRE_SALVO:
+        return f"  {names[event[1]]} fires '{event[2].name}' (salvo - up to 2 hits)"
+    if kind == EVENT_FIRE_SALVO_PLUS:
+        return f"  {names[event[1]]} fires '{event[2].name}' (salvo+ - up to 2 hits)"
+    if kind == EVENT_FIRE_OVERLOAD:
+        return f"  {names[event[1]]} fires '{event[2].name}' at ALL opponents (2 hits each)"
+    if kind == EVENT_FIRE_EMP:
+        return f"  {names[event[1]]} fires EMP at {names[event[2]]}"
+    if kind == EVENT_FORCE_SKIP:
+        return f"  {names[event[1]]} forces {names[event[2]]} to skip their next turn"
+    if kind == EVENT_SALVO_DRAWBACK:
+        if event[2]:
+            return f"    -> Salvo drawback: {names[event[1]]} loses 1 bank currency"
+        return f"    -> Salvo drawback: {names[event[1]]} has no bank currency to lose"
+    if kind == EVENT_OVERLOAD_DRAWBACK:
+        return f"    -> Overload drawback: {names[event[1]]} will skip their next turn"
+    if kind == EVENT_SHATTER_DRAWBACK:
+        if event[2] is None:
+            return f"    -> Shatter drawback: {names[event[1]]} has no card in hand to discard"
+        return f"    -> Shatter drawback: {names[event[1]]} discards random card '{event[2].name}'"
+    if kind == EVENT_SHIELDS_STRIPPED:
+        return (
+            f"    -> All shields stripped from {names[event[1]]}! "
+            f"({event[2]} unshielded ships remain)"
+        )
+
+    if kind == EVENT_REACTIVE_BLOCK:
+        return (
+            f"    -> {names[event[1]]} plays '{event[2].name}' out of turn - rocket blocked (trashed)!"
+        )
+    if kind == EVENT_AEGIS_TRASH:
+        if event[2] is None:
+            return f"    -> Aegis cleanup: {names[event[1]]} has no card in hand/discard to trash"
+        return f"    -> Aegis cleanup: {names[event[1]]} trashes '{event[2].name}' from {event[3]}"
+    if kind == EVENT_IMPACT:
+        return f"    -> {names[event[1]]} chooses impact ship ({event[2]})"
+    if kind == EVENT_WEAK_ROCKET_BLOCKED:
+        return f"    -> {names[event[1]]}'s chosen shielded ship blocks the weak rocket"
+    if kind == EVENT_SHIELD_ABSORB:
+        return f"    -> {names[event[1]]} absorbs with shield ({event[2]} hits remaining)"
+    if kind == EVENT_SHIELD_DESTROYED:
+        shield_zone = "trashed" if event[3] else "removed"
+        return (
+            f"    -> {names[event[1]]} shield destroyed! Ship survives. "
+            f"[{event[2]} ships, shield {shield_zone}]"
+        )
+    if kind == EVENT_STARTER_FLIP:
+        return f"    -> {names[event[1]]}'s ship flips to starter_ship_unshielded_side and survives"
+    if kind == EVENT_LAST_STAND_SAVE:
+        return f"    -> {names[event[1]]} triggers Last Stand Protocol - final ship survives!"
+    if kind == EVENT_SHIP_LOST:
+        return f"    -> {names[event[1]]} loses a ship! ({event[2]} remaining)"
+
+    if kind == EVENT_ASSIGN_SHIELD:
+        _, seat, card, shielded, ships = event
+        return f"  {names[seat]} assigns '{card.name}' ({shielded}/{ships} shielded)"
+    if kind == EVENT_DECOY_RESOLVE:
+        _, seat, drew, discarded = event
+        draw_note = "draws 1" if drew else "draws 0"
+        discarded_name = "none" if discarded is None else discarded.name
+        return f"    -> Decoy Drone resolves immediately: {draw_note}, discards '{discarded_name}'"
+    if kind == EVENT_SHIELD_DISCARDED:
+        return f"  {names[event[1]]} discards '{event[2].name}' (no unshielded ships)"
+    if kind == EVENT_SPECIAL:
+        _, seat, card, other, extra = event
+        return _special_text(names[seat], card, other, extra)
+
+    return f"  <unknown event {kind}>"
@@ -1,11 +1,171 @@
 import random
-from cards import build_starter_deck, build_market_pile
+from operator import attrgetter
+from time import perf_counter_ns
+from cards import build_starter_deck, build_market_pile, deck_template
+from piles import CardPile, Hand
+from events import (
+    EVENT_AEGIS_TRASH,
+    EVENT_ASSIGN_SHIELD,
+    EVENT_BANK,
+    EVENT_BANK_TIEBREAK,
+    EVENT_BUY,
+    EVENT_CHOOSE_BUY,
+    EVENT_CHOOSE_ROCKET,
+    EVENT_CHOOSE_SHIELD,
+    EVENT_CHOOSE_SPECIAL,
+    EVENT_DEBRIS,
+    EVENT_DECOY_RESOLVE,
+    EVENT_DRAW,
+    EVENT_DRAW_NO_CANDIDATES,
+    EVENT_DRAW_TIED,
+    EVENT_EXTRA_TURN,
+    EVENT_EXTRA_TURN_LOST,
+    EVENT_FIRE,
+    EVENT_FIRE_ALL,
+    EVENT_FIRE_EMP,
+    EVENT_FIRE_OVERLOAD,
+    EVENT_FIRE_SALVO,
+    EVENT_FIRE_SALVO_PLUS,
+    EVENT_FORCE_SKIP,
+    EVENT_GAME_START,
+    EVENT_IMPACT,
+    EVENT_LAST_STAND_SAVE,
+    EVENT_MARKET,
+    EVENT_MUTUAL_DESTRUCTION,
+    EVENT_OVERLOAD_DRAWBACK,
+    EVENT_PASS,
+    EVENT_REACTIVE_BLOCK,
+    EVENT_ROSTER,
+    EVENT_SALVO_DRAWBACK,
+    EVENT_SHATTER_DRAWBACK,
+    EVENT_SHIELDS_STRIPPED,
+    EVENT_SHIELD_ABSORB,
+    EVENT_SHIELD_DESTROYED,
+    EVENT_SHIELD_DISCARDED,
+    EVENT_SHIP_LOST,
+    EVENT_SKIP_TURN,
+    EVENT_SPECIAL,
+    EVENT_STARTER_FLIP,
+    EVENT_TURN_LIMIT,
+    EVENT_TURN_LIMIT_NO_PLAYERS,
+    EVENT_TURN_START,
+    EVENT_WEAK_ROCKET_BLOCKED,
+    EVENT_WINNER,
+    EVENT_WRECKAGE,
+    EVENT_WRECKAGE_HIT,
+    EventLog,
+    render_event,
+)
+from combat import (
+    COMBAT_TABLE,
+    HAS_BARE,
+    HAS_BLOCK_ANY,
+    HAS_SHIELDED,
+    HAS_STARTER_BARE,
+    HAS_STARTER_SHIELDED,
+    HIT_ABSORBED,
+    HIT_BLOCKED,
+    HIT_FLIPPED,
+    LAND_BARE,
+    LAND_STARTER,
+    LAND_STARTER_BARE,
+    LAND_WEAKEST_BLOCK_ANY,
+    LAND_WEAKEST_SHIELD,
+)
+from effects import (
+    ASSIGN_SHIELD_EFFECTS,
+    EFFECT_ADD_1_SHIP_TO_FLEET,
+    EFFECT_ASSIGN_BLOCK_1,
+    EFFECT_ASSIGN_BLOCK_1_DRAW_1_DISCARD_1,
+    EFFECT_ASSIGN_BLOCK_2,
+    EFFECT_ASSIGN_BLOCK_ANY,
+    EFFECT_DESTROY_1_SHIP,
+    EFFECT_DESTROY_1_SHIP_THEN_DISCARD_1_RANDOM,
+    EFFECT_DESTROY_1_WEAKEST_SHIP,
+    EFFECT_DESTROY_UP_TO_2_SHIPS,
+    EFFECT_DESTROY_UP_TO_2_SHIPS_THEN_LOSE_1_BANK,
+    EFFECT_DRAW_3_KEEP_2_DISCARD_1,
+    EFFECT_EACH_OPPONENT_BLOCKS_2_AND_SKIP,
+    EFFECT_EACH_OPPONENT_BLOCKS_OR_LOSES_SHIP,
+    EFFECT_GAIN_1_CURRENCY_DRAW_1,
+    EFFECT_LOOK_AT_TOP3_REARRANGE,
+    EFFECT_NEGATE_LAST_SHIP_LOSS,
+    EFFECT_REACTIVE_BLOCK_THEN_TRASH_1,
+    EFFECT_RETRIEVE_1_FROM_DISCARD,
+    EFFECT_SKIP_NEXT_BUY,
+    EFFECT_SKIP_NEXT_TURN,
+    EFFECT_STRIP_ALL_SHIELDS_ONE_OPPONENT,
+    EFFECT_TAKE_EXTRA_TURN,
+    EFFECT_TRASH_1_FROM_DISCARD,
+    EFFECT_TRASH_1_FROM_DISCARD_DRAW_1,
+    EFFECT_UNKNOWN,
+    NUM_CARD_TYPES,
+    NUM_EFFECTS,
+    REACTIVE_BLOCK_EFFECTS,
+    TYPE_CURRENCY,
+    TYPE_DEBRIS,
+    TYPE_ROCKET,
+    TYPE_SHIELD,
+    TYPE_SPECIAL,
+)
 
 HAND_SIZE = 4
 MARKET_DISPLAY_SIZE = 4
 STARTER_SHIP_SHIELDED_SIDE = "starter_ship_shielded_side"
 STARTER_SHIP_UNSHIELDED_SIDE = "starter_ship_unshielded_side"
 
+# Game log levels. LOG_OFF skips message formatting entirely (batch runs);
+# LOG_SUMMARY keeps the starting fleets and the result; LOG_FULL is every step.
+LOG_OFF = 0
+LOG_SUMMARY = 1
+LOG_FULL = 2
+
+# Sort/min/max keys over the per-card values computed at catalog load.
+_by_value = attrgetter("value")
+_by_cost = attrgetter("cost")
+
+
+def _without_one(cards, card):
+    """
+    Returns `cards` minus one copy of `card`. Deck copies share a single Card,
+    so an identity filter would drop every copy instead of just this one.
+    """
+    others = list(cards)
+    if card in others:
+        others.remove(card)
+    return others
+
+
+def _lowest_value(first_zone, first, second_zone, second):
+    """
+    (zone, card) for the lowest-value card in two piles, the first pile's
+    card winning ties; (None, None) when both are empty. Removing that card
+    by identity takes the same copy as its scan position would, since it is
+    the first copy of itself in its pile.
+    """
+    low_first = min(first, key=_by_value, default=None)
+    low_second = min(second, key=_by_value, default=None)
+    if low_first is not None and (low_second is None or low_first.value <= low_second.value):
+        return first_zone, low_first
+    if low_second is not None:
+        return second_zone, low_second
+    return None, None
+
+
+def _landing_ship(fleet, landing):
+    """The first ship of `fleet` in a combat.LAND_* category."""
+    if landing == LAND_WEAKEST_SHIELD:
+        return fleet.first_shielded(fleet.min_shield_hp())
+    if landing == LAND_WEAKEST_BLOCK_ANY:
+        return fleet.first_shielded(fleet.min_shield_hp(EFFECT_ASSIGN_BLOCK_ANY), EFFECT_ASSIGN_BLOCK_ANY)
+    if landing == LAND_STARTER_BARE:
+        return fleet.first_starter_shielded(bare_only=True)
+    if landing == LAND_STARTER:
+        return fleet.first_starter_shielded()
+    if landing == LAND_BARE:
+        return fleet.first_bare()
+    return fleet[0]
+
 
 class Ship:
     """A single ship with optional assigned shield and starter-side state."""
@@ -14,29 +174,46 @@ class Ship:
         self.shield = None
         self.shield_hp = 0
         self.starter_side = starter_side
+        # Set by Fleet.append; every state change is reported to its counters.
+        self.fleet = None
 
     def has_shield(self):
         return self.shield is not None
 
     def assign_shield(self, card):
+        fleet = self.fleet
+        if fleet is not None:
+            fleet._count(self, -1)
         self.shield = card
-        effect = card.get("effect", "")
-        if effect == "assign_to_ship_block_2":
+        effect = card.effect_code
+        if effect == EFFECT_ASSIGN_BLOCK_2:
             self.shield_hp = 2
         else:
             self.shield_hp = 1
+        if fleet is not None:
+            fleet._count(self, 1)
 
     def absorb_hit(self):
+        fleet = self.fleet
+        if fleet is not None:
+            fleet._count(self, -1)
         destroyed_shield = None
         self.shield_hp -= 1
         if self.shield_hp <= 0:
             destroyed_shield = self.shield
             self.shield = None
+        if fleet is not None:
+            fleet._count(self, 1)
         return destroyed_shield
 
     def strip_shield(self):
+        fleet = self.fleet
+        if fleet is not None:
+            fleet._count(self, -1)
         self.shield = None
         self.shield_hp = 0
+        if fleet is not None:
+            fleet._count(self, 1)
 
     def is_on_starter_shielded_side(self):
         return self.starter_side == STARTER_SHIP_SHIELDED_SIDE
@@ -44,28 +221,171 @@ class Ship:
     def flip_starter_shield_side(self):
         if not self.is_on_starter_shielded_side():
             return False
+        fleet = self.fleet
+        if fleet is not None:
+            fleet._count(self, -1)
         self.starter_side = STARTER_SHIP_UNSHIELDED_SIDE
+        if fleet is not None:
+            fleet._count(self, 1)
         return True
 
     def __repr__(self):
         side = "starter-shielded" if self.is_on_starter_shielded_side() else "starter-unshielded"
         if self.shield:
-            return f"[Ship: {side}, shield={self.shield['name']} hp={self.shield_hp}]"
+            return f"[Ship: {side}, shield={self.shield.name} hp={self.shield_hp}]"
         return f"[Ship: {side}, no assigned shield]"
 
 
+class Fleet:
+    """
+    A player's ships in fleet order, plus composition counters kept up to date
+    as ships are added, removed, shielded, hit or flipped:
+
+    - assigned: {(shield effect code, shield hp): ships carrying that shield}
+    - shielded: ships with any assigned shield
+    - block_any: ships carrying an assign_to_ship_block_any shield
+    - starter_shielded: ships still on the starter shielded side
+    - starter_shielded_bare: starter-shielded ships without an assigned shield
+    - bare: ships with neither an assigned shield nor the starter side
+
+    Landing-ship choice and hit estimation read these instead of filtering
+    the ship list; `composition` sums them up as combat.HAS_* bits for the
+    combat outcome table. `version` goes up on every change to the fleet (and to its
+    owner's last stand), so a value computed from the fleet can be cached
+    under the version it was computed at.
+    """
+
+    __slots__ = (
+        "_ships", "assigned", "shielded", "block_any", "starter_shielded", "starter_shielded_bare", "bare", "version",
+    )
+
+    def __init__(self, ships=()):
+        self._ships = []
+        self.assigned = {}
+        self.shielded = 0
+        self.block_any = 0
+        self.starter_shielded = 0
+        self.starter_shielded_bare = 0
+        self.bare = 0
+        self.version = 0
+        for ship in ships:
+            self.append(ship)
+
+    def __len__(self):
+        return len(self._ships)
+
+    def __bool__(self):
+        return bool(self._ships)
+
+    def __iter__(self):
+        return iter(self._ships)
+
+    def __getitem__(self, index):
+        return self._ships[index]
+
+    def __repr__(self):
+        return f"Fleet({self._ships})"
+
+    @property
+    def unshielded(self):
+        return len(self._ships) - self.shielded
+
+    @property
+    def composition(self):
+        return (
+            (self.shielded and HAS_SHIELDED)
+            | (self.block_any and HAS_BLOCK_ANY)
+            | (self.starter_shielded_bare and HAS_STARTER_BARE)
+            | (self.starter_shielded and HAS_STARTER_SHIELDED)
+            | (self.bare and HAS_BARE)
+        )
+
+    def _count(self, ship, delta):
+        self.version += 1
+        on_starter_side = ship.starter_side == STARTER_SHIP_SHIELDED_SIDE
+        if ship.shield is not None:
+            effect = ship.shield.effect_code
+            key = (effect, ship.shield_hp)
+            count = self.assigned.get(key, 0) + delta
+            if count:
+                self.assigned[key] = count
+            else:
+                del self.assigned[key]
+            self.shielded += delta
+            if effect == EFFECT_ASSIGN_BLOCK_ANY:
+                self.block_any += delta
+            if on_starter_side:
+                self.starter_shielded += delta
+        elif on_starter_side:
+            self.starter_shielded += delta
+            self.starter_shielded_bare += delta
+        else:
+            self.bare += delta
+
+    def append(self, ship):
+        ship.fleet = self
+        self._ships.append(ship)
+        self._count(ship, 1)
+
+    def remove(self, ship):
+        self._ships.remove(ship)
+        self._count(ship, -1)
+        ship.fleet = None
+
+    def min_shield_hp(self, effect=None):
+        """Lowest assigned-shield HP (optionally for one shield effect), or None."""
+        hps = [hp for (shield_effect, hp) in self.assigned if effect is None or shield_effect == effect]
+        return min(hps) if hps else None
+
+    def first_shielded(self, hp, effect=None):
+        for ship in self._ships:
+            shield = ship.shield
+            if shield is not None and ship.shield_hp == hp and (effect is None or shield.effect_code == effect):
+                return ship
+        return None
+
+    def first_starter_shielded(self, bare_only=False):
+        for ship in self._ships:
+            if ship.starter_side == STARTER_SHIP_SHIELDED_SIDE and not (bare_only and ship.shield is not None):
+                return ship
+        return None
+
+    def first_bare(self):
+        for ship in self._ships:
+            if ship.shield is None and ship.starter_side != STARTER_SHIP_SHIELDED_SIDE:
+                return ship
+        return None
+
+    def first_unshielded(self):
+        for ship in self._ships:
+            if ship.shield is None:
+                return ship
+        return None
+
+
 class Player:
-    def __init__(self, name, num_ships, starter_df):
+    def __init__(self, name, num_ships, starter, rng=None, seat=0):
         self.name = name
-        self.fleet = [Ship(starter_side=STARTER_SHIP_SHIELDED_SIDE) for _ in range(num_ships)]
-        self.draw_pile = build_starter_deck(starter_df)
-        self.discard_pile = []
-        self.hand = []
-        self.bank_pile = []
-        self.last_stand = False
+        self.seat = seat
+        self.fleet = Fleet(Ship(starter_side=STARTER_SHIP_SHIELDED_SIDE) for _ in range(num_ships))
+        self.draw_pile = build_starter_deck(starter, rng)
+        self.discard_pile = CardPile()
+        self.hand = Hand()
+        self.bank_pile = CardPile()
+        self._last_stand = False
         self.extra_turn = False
         self.skip_next_turn = False
 
+    @property
+    def last_stand(self):
+        return self._last_stand
+
+    @last_stand.setter
+    def last_stand(self, value):
+        if value != self._last_stand:
+            self._last_stand = value
+            self.fleet.version += 1
+
     def is_alive(self):
         return len(self.fleet) > 0
 
@@ -77,18 +397,10 @@ class Player:
     def bank(self):
         return len(self.bank_pile)
 
-    def shielded_ships(self):
-        return [s for s in self.fleet if s.has_shield()]
-
-    def unshielded_ships(self):
-        return [s for s in self.fleet if not s.has_shield()]
-
     def draw_one(self):
         if not self.draw_pile:
             if self.discard_pile:
-                self.draw_pile = self.discard_pile[:]
-                self.discard_pile.clear()
-                random.shuffle(self.draw_pile)
+                self.draw_pile.take_all_from(self.discard_pile)
             else:
                 return
         self.hand.append(self.draw_pile.pop())
@@ -111,15 +423,15 @@ class Player:
             if max_cards is not None and banked >= max_cards:
                 break
 
-            idx = next((i for i, c in enumerate(self.hand) if c.get("type") == "currency"), None)
-            if idx is None:
+            card = self.hand.first(TYPE_CURRENCY)
+            if card is None:
                 break
 
-            card = self.hand.pop(idx)
+            self.hand.remove(card)
             self.bank_pile.append(card)
             banked += 1
 
-            if card.get("effect") == "gain_1_currency_draw_1":
+            if card.effect_code == EFFECT_GAIN_1_CURRENCY_DRAW_1:
                 before = len(self.hand)
                 self.draw_one()
                 if len(self.hand) > before:
@@ -128,15 +440,14 @@ class Player:
         return banked, scout_draws
 
     def discard_debris_from_hand(self):
-        debris_cards = [c for c in self.hand if c.get("type") == "debris"]
+        debris_cards = list(self.hand.of_type(TYPE_DEBRIS))
         for card in debris_cards:
             self.hand.remove(card)
             self.discard_pile.append(card)
         return len(debris_cards)
 
     def available_currency(self):
-        hand_currency = sum(1 for c in self.hand if c.get("type") == "currency")
-        return self.bank + hand_currency
+        return self.bank + self.hand.count(TYPE_CURRENCY)
 
     def spend_currency(self, amount):
         if amount > self.available_currency():
@@ -152,9 +463,7 @@ class Player:
             amount -= 1
 
         while amount > 0:
-            hand_currency = next(
-                (c for c in self.hand if c.get("type") == "currency"), None
-            )
+            hand_currency = self.hand.first(TYPE_CURRENCY)
             if hand_currency is None:
                 break
             self.hand.remove(hand_currency)
@@ -168,7 +477,7 @@ class Player:
         return spent_from_bank, spent_from_hand
 
     def __repr__(self):
-        shielded = len(self.shielded_ships())
+        shielded = self.fleet.shielded
         return (
             f"{self.name} | Ships:{self.ship_count}({shielded} shielded) "
             f"| Hand:{len(self.hand)} | Bank:{self.bank} "
@@ -177,7 +486,41 @@ class Player:
 
 
 class Game:
-    def __init__(self, player_names, starter_df, abilities_df):
+    def __init__(self, player_names, starter, abilities, seed=None, log_level=LOG_FULL,
+                 keep_events=True, recorder=None, phase_times=None, telemetry=None):
+        """
+        starter / abilities: CardCatalog deck templates (starter_deck,
+        market_pile), catalog rows, or the DataFrames from load_all_decks.
+        Anything but a template is expanded here, once per game.
+
+        seed: int seed or a random.Random. Every shuffle and random choice in
+        the game draws from self.rng, so the same int seed replays the same
+        game. Without one, a seed is drawn from the global random module and
+        kept in self.seed.
+
+        log_level: LOG_OFF, LOG_SUMMARY or LOG_FULL (see module constants).
+        The game records events (see events.py) in self.events, an
+        events.EventLog; `log` renders them to text on demand.
+        keep_events=False only delivers them to subscribers (e.g. a
+        logsink.LogWriter streaming to a file).
+
+        recorder: optional trajectory.TrajectoryRecorder, called at the end
+        of every turn and every round.
+
+        phase_times: optional timing.PhaseTimes; when given, every turn's
+        phases are timed into it (see _play_turn_timed).
+
+        telemetry: optional telemetry.EffectTelemetry counting, per effect,
+        cards chosen, handlers resolved, shots blocked and handler time.
+        """
+        if isinstance(seed, random.Random):
+            self.seed = None
+            self.rng = seed
+        else:
+            self.seed = random.getrandbits(64) if seed is None else seed
+            self.rng = random.Random(self.seed)
+        starter = deck_template(starter, "quantity")
+        abilities = deck_template(abilities, "copies")
         n = len(player_names)
         if n == 2:
             starting_ships = 6
@@ -188,17 +531,56 @@ class Game:
         else:
             starting_ships = 3
 
-        self.players = [Player(name, starting_ships, starter_df) for name in player_names]
-        self.abilities_pile = build_market_pile(abilities_df)
+        self.players = [
+            Player(name, starting_ships, starter, self.rng, seat)
+            for seat, name in enumerate(player_names)
+        ]
+        self.abilities_pile = build_market_pile(abilities, self.rng)
         self.market_display = [None] * MARKET_DISPLAY_SIZE
-        self.trash_pile = []
+        self.trash_pile = CardPile()
         self.turn_number = 0
-        self.log = []
+        self.max_turns = None
+        self.hit_turn_limit = False   # set when run() ends on the max_turns cap
+        self.log_level = log_level
+        self.events = EventLog()
+        self.keep_events = keep_events
+        self._subscribers = []
         self.attack_counts = {name: 0 for name in player_names}
         self.ships_destroyed_this_round = 0
         self.ship_hits_this_round = 0
+        # Whole-game tallies for the results store.
+        self.cards_bought = [0] * NUM_CARD_TYPES
+        self.rockets_fired = 0
+        self.recorder = recorder
+        self.phase_times = phase_times
+        self.telemetry = telemetry
+        # Effect of the rocket being resolved, for telemetry's blocked counts.
+        self._effect_in_play = EFFECT_UNKNOWN
+        # Hit estimates for the decision in progress; see _estimate_hit_value.
+        self._hit_values = {}
         self.refill_market_display()
 
+    def subscribe(self, callback, kinds=None):
+        """
+        Calls callback(event) for each event of the given EVENT_* kinds (all
+        kinds when None) as it happens. Only events the log level records
+        are delivered.
+        """
+        self._subscribers.append((None if kinds is None else frozenset(kinds), callback))
+
+    def _emit(self, *event):
+        if self.keep_events:
+            self.events.append(event)
+        for kinds, callback in self._subscribers:
+            if kinds is None or event[0] in kinds:
+                callback(event)
+
+    @property
+    def log(self):
+        """The game log as text lines, rendered from the recorded events."""
+        names = [p.name for p in self.players]
+        return [render_event(event, names) for event in self.events]
+
     def _draw_ability(self):
         if not self.abilities_pile:
             return None
@@ -209,149 +591,98 @@ class Game:
             if self.market_display[i] is None:
                 self.market_display[i] = self._draw_ability()
 
-    def _card_cost(self, card):
-        return int(card.get("cost", 0))
-
     def _alive_opponents(self, player):
         return [p for p in self.players if p != player and p.is_alive()]
 
-    def _card_intrinsic_value(self, card):
-        card_type = card.get("type", "")
-        effect = card.get("effect", "")
-        if card_type == "rocket":
-            return {
-                "destroy_1_ship": 8.0,
-                "destroy_1_ship_then_discard_1_random_card_from_hand": 7.4,
-                "destroy_1_weakest_ship": 8.5,
-                "destroy_1_ship_ignore_shields": 9.2,
-                "strip_all_shields_one_opponent": 7.8,
-                "each_opponent_blocks_or_loses_ship": 10.0,
-                "destroy_up_to_2_ships": 10.5,
-                "destory_up_to_2_ships": 10.5,
-                "destroy_up_to_2_ships_then_lose_one_1_bank_currency": 9.3,
-                "destroy_1_unshielded_ship": 6.0,
-                "skip_next_turn": 4.8,
-                "skip_next_buy": 4.8,
-                "each_opponent_blocks_2_or_loses_2_ships_and_you_skip_next_turn": 11.2,
-            }.get(effect, 7.5)
-        if card_type == "shield":
-            return {
-                "assign_to_ship_block_1": 6.2,
-                "assign_to_ship_block_1_draw_1_discard_1": 6.8,
-                "assign_to_ship_block_2": 8.2,
-                "assign_to_ship_block_any": 9.0,
-                "reactive_block_1_rocket": 7.0,
-                "reactive_block_1_rocket_then_trash_1_card_from_hand_or_discard": 7.6,
-                "cancel_1_rocket_targeting_you": 7.0,
-            }.get(effect, 5.5)
-        if card_type == "special":
-            return {
-                "draw_3_keep_2_discard_1": 6.5,
-                "retrieve_1_card_from_discard": 7.0,
-                "look_at_top3_any_market_rearrange": 5.0,
-                "negate_last_ship_loss_once": 7.5,
-                "add_1_ship_to_fleet": 8.2,
-                "take_extra_turn": 9.8,
-                "skip_next_turn": 1.0,
-                "skip_next_buy": 1.0,
-            }.get(effect, 5.0)
-        if card_type == "currency":
-            return 2.0
-        if card_type == "debris":
-            return -4.0
-        return 0.0
-
     def market_options(self):
         return [(idx, card) for idx, card in enumerate(self.market_display) if card is not None]
 
     def _score_special_card(self, player, card):
-        if card.get("type") != "special":
+        if card.type_code != TYPE_SPECIAL:
             return -999.0
-        effect = card.get("effect", "")
-
-        if effect == "take_extra_turn":
-            followup_rockets = sum(
-                1 for c in player.hand if c is not card and c.get("type") == "rocket"
-            )
-            followup_buy = min(player.available_currency(), 5)
-            return 8.5 + 1.8 * followup_rockets + 0.4 * followup_buy
-
-        if effect == "add_1_ship_to_fleet":
-            return 5.0 + max(0, 6 - player.ship_count) * 1.5
-
-        if effect == "negate_last_ship_loss_once":
-            if player.last_stand:
-                return -1.0
-            if player.ship_count <= 2:
-                return 9.0
-            if player.ship_count == 3:
-                return 6.5
-            return 3.5
-
-        if effect == "retrieve_1_card_from_discard":
-            pool = [c for c in player.discard_pile if c is not card]
-            if not pool:
-                return -1.0
-            best = max(pool, key=self._card_intrinsic_value)
-            return 4.5 + 0.7 * self._card_intrinsic_value(best)
-
-        if effect == "draw_3_keep_2_discard_1":
-            clutter = sum(
-                1 for c in player.hand if c is not card and c.get("type") in ("currency", "debris")
-            )
-            return 5.0 + 0.9 * clutter
-
-        if effect == "look_at_top3_any_market_rearrange":
-            high_visible = any(
-                c is not None and self._card_cost(c) >= 4 for c in self.market_display
-            )
-            return 3.5 + (1.0 if high_visible else 0.0)
-
-        if effect == "trash_1_card_from_discard":
-            # Deck Purge can trash from either discard or hand.
-            # Include this card itself because it will be in discard after play.
-            pool = list(player.discard_pile) + [c for c in player.hand if c is not card] + [card]
-            worst = min(pool, key=self._card_intrinsic_value)
-            # Higher score when we can remove low-value cards (debris/currency).
-            return 4.0 + max(0.0, 4.0 - self._card_intrinsic_value(worst)) * 0.8
-
-        if effect == "trash_1_card_from_discard_draw_1":
-            pool = [c for c in player.discard_pile if c is not card]
-            if not pool:
-                return 1.0
-            worst = min(pool, key=self._card_intrinsic_value)
-            return 5.0 + max(0.0, 4.0 - self._card_intrinsic_value(worst)) * 0.8
-
-        if effect in ("skip_next_turn", "skip_next_buy"):
-            return -2.0
-
+        return EFFECT_HANDLERS[TYPE_SPECIAL][card.effect_code].score(self, player, card)
+
+    def _score_extra_turn(self, player, card):
+        followup_rockets = player.hand.count(TYPE_ROCKET)
+        followup_buy = min(player.available_currency(), 5)
+        return 8.5 + 1.8 * followup_rockets + 0.4 * followup_buy
+
+    def _score_add_ship(self, player, card):
+        return 5.0 + max(0, 6 - player.ship_count) * 1.5
+
+    def _score_last_stand(self, player, card):
+        if player.last_stand:
+            return -1.0
+        if player.ship_count <= 2:
+            return 9.0
+        if player.ship_count == 3:
+            return 6.5
+        return 3.5
+
+    def _score_salvage(self, player, card):
+        # Scored cards sit in hand or market, never in discard.
+        pool = player.discard_pile
+        if not pool:
+            return -1.0
+        best = max(pool, key=_by_value)
+        return 4.5 + 0.7 * best.value
+
+    def _score_recon(self, player, card):
+        clutter = player.hand.count(TYPE_CURRENCY) + player.hand.count(TYPE_DEBRIS)
+        return 5.0 + 0.9 * clutter
+
+    def _score_arms_dealer(self, player, card):
+        high_visible = any(
+            c is not None and c.cost >= 4 for c in self.market_display
+        )
+        return 3.5 + (1.0 if high_visible else 0.0)
+
+    def _score_deck_purge(self, player, card):
+        # Deck Purge can trash from either discard or hand.
+        # Include this card itself because it will be in discard after play.
+        pool = list(player.discard_pile) + list(player.hand) + [card]
+        worst = min(pool, key=_by_value)
+        # Higher score when we can remove low-value cards (debris/currency).
+        return 4.0 + max(0.0, 4.0 - worst.value) * 0.8
+
+    def _score_deep_clean(self, player, card):
+        pool = player.discard_pile
+        if not pool:
+            return 1.0
+        worst = min(pool, key=_by_value)
+        return 5.0 + max(0.0, 4.0 - worst.value) * 0.8
+
+    def _score_self_skip(self, player, card):
+        return -2.0
+
+    def _score_plain_special(self, player, card):
         return 2.0
 
     def _score_buy_card(self, player, card):
-        score = self._card_intrinsic_value(card) + 0.45 * self._card_cost(card)
-        card_type = card.get("type", "")
-        effect = card.get("effect", "")
+        score = card.value + 0.45 * card.cost
+        card_type = card.type_code
+        effect = card.effect_code
 
-        if card_type == "rocket":
+        if card_type == TYPE_ROCKET:
             if not self._alive_opponents(player):
                 score -= 6.0
-            if not any(c.get("type") == "rocket" for c in player.hand):
+            if not player.hand.count(TYPE_ROCKET):
                 score += 1.2
-        elif card_type == "shield":
-            unshielded = len(player.unshielded_ships())
-            if "assign_to_ship" in str(effect):
+        elif card_type == TYPE_SHIELD:
+            unshielded = player.fleet.unshielded
+            if effect in ASSIGN_SHIELD_EFFECTS:
                 if unshielded == 0:
                     score -= 3.0
                 else:
                     score += min(unshielded, 3) * 0.8
             if player.ship_count <= 3:
                 score += 0.8
-        elif card_type == "special":
+        elif card_type == TYPE_SPECIAL:
             score += 0.8 * self._score_special_card(player, card)
 
-        if player.bank >= self._card_cost(card):
+        if player.bank >= card.cost:
             score += 0.4
-        if player.available_currency() - self._card_cost(card) == 0:
+        if player.available_currency() - card.cost == 0:
             score += 0.3
 
         return score
@@ -359,13 +690,13 @@ class Game:
     def pick_buy_option(self, player):
         affordable = []
         for idx, card in self.market_options():
-            if self._card_cost(card) <= player.available_currency():
+            if card.cost <= player.available_currency():
                 score = self._score_buy_card(player, card)
                 affordable.append((idx, card, score))
         if not affordable:
             return None, None, -999.0
         affordable.sort(
-            key=lambda x: (x[2], self._card_cost(x[1]), x[1].get("name", "")),
+            key=lambda x: (x[2], x[1].cost, x[1].name),
             reverse=True,
         )
         return affordable[0]
@@ -375,182 +706,104 @@ class Game:
         if card is None:
             return False
 
-        cost = self._card_cost(card)
+        cost = card.cost
         if cost > player.available_currency():
             return False
 
         spent_bank, spent_hand = player.spend_currency(cost)
 
-        if card.get("effect") == "add_1_ship_to_fleet":
+        if card.effect_code == EFFECT_ADD_1_SHIP_TO_FLEET:
             # Reinforcement Shuttle: immediate fleet deploy on buy.
             player.fleet.append(Ship(starter_side=STARTER_SHIP_UNSHIELDED_SIDE))
-            destination_note = "deployed to fleet (unshielded)"
+            deployed = True
+            if self.telemetry is not None:
+                self.telemetry.chosen[EFFECT_ADD_1_SHIP_TO_FLEET] += 1
+                self.telemetry.resolved[EFFECT_ADD_1_SHIP_TO_FLEET] += 1
         else:
             player.discard_pile.append(card)
-            destination_note = "to discard"
+            deployed = False
 
         self.market_display[slot_idx] = None
         self.refill_market_display()
-        self.log.append(
-            f"  {player.name} buys '{card['name']}' (cost {cost}) "
-            f"[spent bank:{spent_bank}, hand:{spent_hand}, bank left:{player.bank}; {destination_note}]"
-        )
+        self.cards_bought[card.type_code] += 1
+        if self.log_level >= LOG_FULL:
+            self._emit(
+                EVENT_BUY, player.seat, card, cost, spent_bank, spent_hand, player.bank, deployed
+            )
         return True
 
     def _fire_at(self, attacker, target, effect):
         self.attack_counts[target.name] += 1
+        telemetry = self.telemetry
 
         emergency = next(
-            (
-                c
-                for c in target.hand
-                if c.get("effect") in (
-                    "reactive_block_1_rocket",
-                    "reactive_block_1_rocket_then_trash_1_card_from_hand_or_discard",
-                    "reactive_block_1_rocket_then_trash_1_card_from_hand_or_discards",
-                    "cancel_1_rocket_targeting_you",
-                )
-            ),
+            (c for c in target.hand.of_type(TYPE_SHIELD) if c.effect_code in REACTIVE_BLOCK_EFFECTS),
             None,
         )
         if emergency:
             target.hand.remove(emergency)
             # Reactive shields are one-time use.
             self.trash_pile.append(emergency)
-            self.log.append(
-                f"    -> {target.name} plays '{emergency['name']}' out of turn - rocket blocked (trashed)!"
-            )
-
-            if emergency.get("effect") in (
-                "reactive_block_1_rocket_then_trash_1_card_from_hand_or_discard",
-                "reactive_block_1_rocket_then_trash_1_card_from_hand_or_discards",
-            ):
-                candidates = []
-                for idx, c in enumerate(target.hand):
-                    candidates.append(("hand", idx, c))
-                for idx, c in enumerate(target.discard_pile):
-                    candidates.append(("discard", idx, c))
-
-                if candidates:
-                    zone, idx, to_trash = min(candidates, key=lambda t: self._card_intrinsic_value(t[2]))
-                    if zone == "hand":
-                        target.hand.pop(idx)
-                    else:
-                        target.discard_pile.pop(idx)
-                    self.trash_pile.append(to_trash)
-                    self.log.append(
-                        f"    -> Aegis cleanup: {target.name} trashes '{to_trash['name']}' from {zone}"
-                    )
-                else:
-                    self.log.append(
-                        f"    -> Aegis cleanup: {target.name} has no card in hand/discard to trash"
-                    )
+            if self.log_level >= LOG_FULL:
+                self._emit(EVENT_REACTIVE_BLOCK, target.seat, emergency)
+            if telemetry is not None:
+                telemetry.resolved[emergency.effect_code] += 1
+                telemetry.blocked[self._effect_in_play] += 1
+
+            react = EFFECT_HANDLERS[TYPE_SHIELD][emergency.effect_code].react
+            if react is not None:
+                react(self, target, emergency)
             return
 
-        self.fire_rocket(attacker, target, effect)
+        if not self.fire_rocket(attacker, target, effect) and telemetry is not None:
+            telemetry.blocked[self._effect_in_play] += 1
 
-    def _choose_landing_ship(self, target, effect):
-        """
-        Defender chooses where the rocket lands on their fleet.
-        In simulation this choice is made by defensive AI to minimize damage.
-        """
-        assigned_shielded = target.shielded_ships()
-        starter_shielded = [s for s in target.fleet if s.is_on_starter_shielded_side()]
-        starter_shielded_no_assigned = [s for s in starter_shielded if not s.has_shield()]
-        fully_unshielded = [
-            s for s in target.fleet if (not s.has_shield()) and (not s.is_on_starter_shielded_side())
-        ]
-
-        weak_rocket = effect == "destroy_1_unshielded_ship"
-        ignore_shields = effect == "destroy_1_ship_ignore_shields"
-
-        def lowest_hp_shield_ship(ships):
-            return min(ships, key=lambda s: s.shield_hp)
-
-        # Weak rockets are best routed into any shield layer first.
-        if weak_rocket:
-            if assigned_shielded:
-                return lowest_hp_shield_ship(assigned_shielded)
-            if starter_shielded_no_assigned:
-                return starter_shielded_no_assigned[0]
-            if fully_unshielded:
-                return fully_unshielded[0]
-            return target.fleet[0]
-
-        # Piercing rockets can still be blocked by block_any assigned shields.
-        if ignore_shields:
-            block_any = [
-                s
-                for s in assigned_shielded
-                if s.shield and s.shield.get("effect") == "assign_to_ship_block_any"
-            ]
-            if block_any:
-                return lowest_hp_shield_ship(block_any)
-            if starter_shielded_no_assigned:
-                return starter_shielded_no_assigned[0]
-            if starter_shielded:
-                return starter_shielded[0]
-            if fully_unshielded:
-                return fully_unshielded[0]
-            if assigned_shielded:
-                return lowest_hp_shield_ship(assigned_shielded)
-            return target.fleet[0]
-
-        # Normal rockets: route into assigned shields, then starter-shielded side.
-        if assigned_shielded:
-            return lowest_hp_shield_ship(assigned_shielded)
-        if starter_shielded_no_assigned:
-            return starter_shielded_no_assigned[0]
-        if fully_unshielded:
-            return fully_unshielded[0]
-        return target.fleet[0]
+    def _react_aegis(self, target, card):
+        """Aegis Countermeasure: after blocking, trash the defender's lowest-value card."""
+        zone, to_trash = _lowest_value("hand", target.hand, "discard", target.discard_pile)
+        if to_trash is not None:
+            if zone == "hand":
+                target.hand.remove(to_trash)
+            else:
+                target.discard_pile.remove(to_trash)
+            self.trash_pile.append(to_trash)
+            if self.log_level >= LOG_FULL:
+                self._emit(EVENT_AEGIS_TRASH, target.seat, to_trash, zone)
+        elif self.log_level >= LOG_FULL:
+            self._emit(EVENT_AEGIS_TRASH, target.seat, None, None)
 
     def _estimate_hit_value(self, target, effect):
+        # Memoised for the current decision; the fleet version in the key
+        # retires an entry as soon as the target's fleet changes.
+        key = (target, effect, target.fleet.version)
+        value = self._hit_values.get(key)
+        if value is None:
+            value = self._hit_values[key] = self._compute_hit_value(target, effect)
+        return value
+
+    def _compute_hit_value(self, target, effect):
         if not target.is_alive():
             return 0.0
 
-        shielded = target.shielded_ships()
-        if effect == "strip_all_shields_one_opponent":
-            return len(shielded) * 2.8 + (1.0 if shielded else 0.0)
-
-        landing_ship = self._choose_landing_ship(target, effect)
-        weak_rocket = effect == "destroy_1_unshielded_ship"
-        ignore_shields = effect == "destroy_1_ship_ignore_shields"
-        landing_shield = landing_ship.shield
-        landing_effect = landing_shield.get("effect", "") if landing_shield else ""
-        starter_side_shielded = landing_ship.is_on_starter_shielded_side()
+        fleet = target.fleet
+        if effect == EFFECT_STRIP_ALL_SHIELDS_ONE_OPPONENT:
+            return fleet.shielded * 2.8 + (1.0 if fleet.shielded else 0.0)
 
-        assigned_shield_blocks = (
-            landing_shield is not None
-            and (weak_rocket or (not ignore_shields) or landing_effect == "assign_to_ship_block_any")
-        )
-
-        if assigned_shield_blocks:
-            ship_loss = False
-            starter_flip = False
-        elif starter_side_shielded:
-            ship_loss = False
-            starter_flip = True
-        else:
-            ship_loss = True
-            starter_flip = False
-
-        if ship_loss:
-            value = 6.0 + (7 - target.ship_count) * 0.9
-            if target.ship_count == 1:
-                value += 3.0
-                if target.last_stand:
-                    value = 2.4
-            return value
-
-        if assigned_shield_blocks:
-            if weak_rocket and landing_shield is not None:
-                return 0.0
-            return 1.8 + (1.0 if landing_ship.shield_hp == 1 else 0.4)
-
-        if starter_flip:
+        landing, outcome = COMBAT_TABLE[effect][fleet.composition]
+        if outcome == HIT_BLOCKED:
+            return 0.0
+        if outcome == HIT_ABSORBED:
+            blocking_hp = fleet.min_shield_hp(EFFECT_ASSIGN_BLOCK_ANY if landing == LAND_WEAKEST_BLOCK_ANY else None)
+            return 1.8 + (1.0 if blocking_hp == 1 else 0.4)
+        if outcome == HIT_FLIPPED:
             return 2.0
-        return 0.0
+
+        value = 6.0 + (7 - target.ship_count) * 0.9
+        if target.ship_count == 1:
+            value += 3.0
+            if target.last_stand:
+                value = 2.4
+        return value
 
     def _pick_best_target(self, attacker, alive_opponents, effect):
         if not alive_opponents:
@@ -561,138 +814,129 @@ class Game:
             scored.append((score, -opp.ship_count, opp))
         max_score = max(s[0] for s in scored)
         top = [s[2] for s in scored if abs(s[0] - max_score) < 1e-9]
-        return random.choice(top)
+        return self.rng.choice(top)
 
     def _score_rocket_card(self, player, card):
-        if card.get("type") != "rocket":
+        if card.type_code != TYPE_ROCKET:
             return -999.0
         alive_opponents = self._alive_opponents(player)
         if not alive_opponents:
             return -999.0
+        return EFFECT_HANDLERS[TYPE_ROCKET][card.effect_code].score(self, player, card, alive_opponents)
 
-        effect = card.get("effect", "")
-        if effect == "each_opponent_blocks_or_loses_ship":
-            return (
-                sum(self._estimate_hit_value(opp, "destroy_1_ship") for opp in alive_opponents)
-                + 1.2 * len(alive_opponents)
-            )
-        if effect in ("destroy_up_to_2_ships", "destory_up_to_2_ships"):
-            hits = sorted(
-                [self._estimate_hit_value(opp, "destroy_1_ship") for opp in alive_opponents],
-                reverse=True,
-            )
-            return sum(hits[:2]) + 1.2
-        if effect == "destroy_up_to_2_ships_then_lose_one_1_bank_currency":
-            hits = sorted(
-                [self._estimate_hit_value(opp, "destroy_1_ship") for opp in alive_opponents],
-                reverse=True,
-            )
-            bank_penalty = 0.9 if player.bank > 0 else 1.6
-            return sum(hits[:2]) + 0.2 - bank_penalty
-        if effect in ("skip_next_turn", "skip_next_buy"):
-            return max(self._estimate_hit_value(opp, "destroy_1_ship") for opp in alive_opponents) * 0.4 + 1.4
-        if effect == "each_opponent_blocks_2_or_loses_2_ships_and_you_skip_next_turn":
-            total = 0.0
-            for opp in alive_opponents:
-                hit_value = self._estimate_hit_value(opp, "destroy_1_ship")
-                total += hit_value + max(0.8, hit_value * 0.8)
-            self_penalty = 2.4 + (1.2 if player.ship_count <= 2 else 0.0)
-            return total - self_penalty
-        if effect == "destroy_1_ship_then_discard_1_random_card_from_hand":
-            hit = max(self._estimate_hit_value(opp, "destroy_1_ship") for opp in alive_opponents)
-            other_cards = [c for c in player.hand if c is not card]
-            if not other_cards:
-                return hit
-            avg_loss = sum(self._card_intrinsic_value(c) for c in other_cards) / len(other_cards)
-            return hit - max(0.0, avg_loss) * 0.35
-        if effect == "strip_all_shields_one_opponent":
-            return max(self._estimate_hit_value(opp, effect) for opp in alive_opponents) + 0.6
-        if effect == "destroy_1_weakest_ship":
-            return max(self._estimate_hit_value(opp, "destroy_1_ship") for opp in alive_opponents) + 0.5
+    def _score_barrage(self, player, card, alive_opponents):
+        return (
+            sum(self._estimate_hit_value(opp, EFFECT_DESTROY_1_SHIP) for opp in alive_opponents)
+            + 1.2 * len(alive_opponents)
+        )
+
+    def _score_twin_salvo(self, player, card, alive_opponents):
+        hits = sorted(
+            [self._estimate_hit_value(opp, EFFECT_DESTROY_1_SHIP) for opp in alive_opponents],
+            reverse=True,
+        )
+        return sum(hits[:2]) + 1.2
+
+    def _score_salvo(self, player, card, alive_opponents):
+        hits = sorted(
+            [self._estimate_hit_value(opp, EFFECT_DESTROY_1_SHIP) for opp in alive_opponents],
+            reverse=True,
+        )
+        bank_penalty = 0.9 if player.bank > 0 else 1.6
+        return sum(hits[:2]) + 0.2 - bank_penalty
+
+    def _score_force_skip(self, player, card, alive_opponents):
+        return max(self._estimate_hit_value(opp, EFFECT_DESTROY_1_SHIP) for opp in alive_opponents) * 0.4 + 1.4
+
+    def _score_overload(self, player, card, alive_opponents):
+        total = 0.0
+        for opp in alive_opponents:
+            hit_value = self._estimate_hit_value(opp, EFFECT_DESTROY_1_SHIP)
+            total += hit_value + max(0.8, hit_value * 0.8)
+        self_penalty = 2.4 + (1.2 if player.ship_count <= 2 else 0.0)
+        return total - self_penalty
+
+    def _score_shatter(self, player, card, alive_opponents):
+        hit = max(self._estimate_hit_value(opp, EFFECT_DESTROY_1_SHIP) for opp in alive_opponents)
+        other_cards = _without_one(player.hand, card)
+        if not other_cards:
+            return hit
+        avg_loss = sum(c.value for c in other_cards) / len(other_cards)
+        return hit - max(0.0, avg_loss) * 0.35
+
+    def _score_emp(self, player, card, alive_opponents):
+        effect = card.effect_code
+        return max(self._estimate_hit_value(opp, effect) for opp in alive_opponents) + 0.6
+
+    def _score_seeking(self, player, card, alive_opponents):
+        return max(self._estimate_hit_value(opp, EFFECT_DESTROY_1_SHIP) for opp in alive_opponents) + 0.5
+
+    def _score_single_rocket(self, player, card, alive_opponents):
+        effect = card.effect_code
         return max(self._estimate_hit_value(opp, effect) for opp in alive_opponents)
 
     def _select_best_rocket_card(self, player):
-        rocket_cards = [c for c in player.hand if c.get("type") == "rocket"]
+        rocket_cards = player.hand.of_type(TYPE_ROCKET)
         if not rocket_cards:
             return None, -999.0
         scored = [(self._score_rocket_card(player, c), c) for c in rocket_cards]
-        scored.sort(key=lambda x: (x[0], self._card_intrinsic_value(x[1])), reverse=True)
+        scored.sort(key=lambda x: (x[0], x[1].value), reverse=True)
         return scored[0][1], scored[0][0]
 
     def fire_rocket(self, attacker, target, effect):
+        """Resolves one hit on `target`; returns True if it destroyed a ship."""
         if not target.is_alive():
-            return
-
-        ignore_shields = effect == "destroy_1_ship_ignore_shields"
-        weak_rocket = effect == "destroy_1_unshielded_ship"
+            return False
 
-        hit_ship = self._choose_landing_ship(target, effect)
-        landing_shield = hit_ship.shield
-        landing_effect = landing_shield.get("effect", "") if landing_shield else ""
-        starter_side_shielded = hit_ship.is_on_starter_shielded_side()
+        # The defender lands the hit where it costs them least (see combat.py).
+        landing, outcome = COMBAT_TABLE[effect][target.fleet.composition]
+        hit_ship = _landing_ship(target.fleet, landing)
 
-        if landing_shield:
-            impact_zone = "assigned_shield"
-        elif starter_side_shielded:
-            impact_zone = STARTER_SHIP_SHIELDED_SIDE
-        else:
-            impact_zone = STARTER_SHIP_UNSHIELDED_SIDE
-
-        self.log.append(
-            f"    -> {target.name} chooses impact ship ({impact_zone})"
-        )
+        if self.log_level >= LOG_FULL:
+            if hit_ship.shield:
+                impact_zone = "assigned_shield"
+            else:
+                impact_zone = hit_ship.starter_side
+            self._emit(EVENT_IMPACT, target.seat, impact_zone)
         self.ship_hits_this_round += 1
 
-        if weak_rocket and landing_shield is not None:
-            self.log.append(
-                f"    -> {target.name}'s chosen shielded ship blocks the weak rocket"
-            )
-            return
-
-        shield_blocks = (
-            landing_shield is not None
-            and (not ignore_shields or landing_effect == "assign_to_ship_block_any")
-        )
+        if outcome == HIT_BLOCKED:
+            if self.log_level >= LOG_FULL:
+                self._emit(EVENT_WEAK_ROCKET_BLOCKED, target.seat)
+            return False
 
-        if shield_blocks:
+        if outcome == HIT_ABSORBED:
             destroyed_shield = hit_ship.absorb_hit()
             if hit_ship.shield:
-                self.log.append(
-                    f"    -> {target.name} absorbs with shield "
-                    f"({hit_ship.shield_hp} hits remaining)"
-                )
+                if self.log_level >= LOG_FULL:
+                    self._emit(EVENT_SHIELD_ABSORB, target.seat, hit_ship.shield_hp)
             else:
                 if destroyed_shield is not None:
                     # Assigned shields are trashed when broken.
                     self.trash_pile.append(destroyed_shield)
-                    shield_zone = "trashed"
-                else:
-                    shield_zone = "removed"
-                self.log.append(
-                    f"    -> {target.name} shield destroyed! Ship survives. "
-                    f"[{target.ship_count} ships, shield {shield_zone}]"
-                )
-            return
+                if self.log_level >= LOG_FULL:
+                    self._emit(
+                        EVENT_SHIELD_DESTROYED, target.seat, target.ship_count, destroyed_shield is not None
+                    )
+            return False
 
-        if hit_ship.flip_starter_shield_side():
-            self.log.append(
-                f"    -> {target.name}'s ship flips to {STARTER_SHIP_UNSHIELDED_SIDE} and survives"
-            )
-            return
+        if outcome == HIT_FLIPPED:
+            hit_ship.flip_starter_shield_side()
+            if self.log_level >= LOG_FULL:
+                self._emit(EVENT_STARTER_FLIP, target.seat)
+            return False
 
-        ship_to_lose = hit_ship
         if target.ship_count == 1 and target.last_stand:
             target.last_stand = False
-            self.log.append(
-                f"    -> {target.name} triggers Last Stand Protocol - final ship survives!"
-            )
-            return
-        ship_to_lose.strip_shield()
-        target.fleet.remove(ship_to_lose)
+            if self.log_level >= LOG_FULL:
+                self._emit(EVENT_LAST_STAND_SAVE, target.seat)
+            return False
+        hit_ship.strip_shield()
+        target.fleet.remove(hit_ship)
         self.ships_destroyed_this_round += 1
-        self.log.append(
-            f"    -> {target.name} loses a ship! ({target.ship_count} remaining)"
-        )
+        if self.log_level >= LOG_FULL:
+            self._emit(EVENT_SHIP_LOST, target.seat, target.ship_count)
+        return True
 
     def _apply_unavoidable_ship_wreckage(self, duel_players):
         """
@@ -700,18 +944,17 @@ class Game:
         if no ships were destroyed in the round, each of the 2 remaining players
         suffers one unavoidable rocket-like hit.
         """
-        self.log.append(
-            "  !! Unavoidable Ship Wreckage: no ships were destroyed this round, "
-            "each duelist suffers 1 unavoidable hit."
-        )
+        if self.log_level >= LOG_FULL:
+            self._emit(EVENT_WRECKAGE)
         for player in duel_players:
             if not player.is_alive():
                 continue
             # Apply one direct hit without reactive shield responses.
             # This degrades defense by one step: assigned-shield HP, starter side,
             # or (if fully unshielded) a ship loss.
-            self.log.append(f"    -> {player.name} must take 1 wreckage hit.")
-            self.fire_rocket(player, player, "destroy_1_ship")
+            if self.log_level >= LOG_FULL:
+                self._emit(EVENT_WRECKAGE_HIT, player.seat)
+            self.fire_rocket(player, player, EFFECT_DESTROY_1_SHIP)
 
     def _resolve_draw_by_bank(self, candidates):
         """
@@ -719,59 +962,50 @@ class Game:
         highest bank currency wins. If tied for highest bank, result remains Draw.
         """
         if not candidates:
-            self.log.append("\nDraw: no eligible players for bank tiebreak.")
+            if self.log_level >= LOG_SUMMARY:
+                self._emit(EVENT_DRAW_NO_CANDIDATES)
             return "Draw"
         max_bank = max(p.bank for p in candidates)
         leaders = [p for p in candidates if p.bank == max_bank]
         if len(leaders) == 1:
             winner = leaders[0]
-            self.log.append(
-                f"\nBank tiebreak: {winner.name} wins with {winner.bank} bank currency."
-            )
+            if self.log_level >= LOG_SUMMARY:
+                self._emit(EVENT_BANK_TIEBREAK, winner.seat, winner.bank)
             return winner.name
-        self.log.append(
-            f"\nDraw: bank tiebreak tied at {max_bank} currency among "
-            f"{', '.join(p.name for p in leaders)}."
-        )
+        if self.log_level >= LOG_SUMMARY:
+            self._emit(EVENT_DRAW_TIED, max_bank, tuple(p.seat for p in leaders))
         return "Draw"
 
     def _score_shield_card(self, player, card):
-        if card.get("type") != "shield":
+        if card.type_code != TYPE_SHIELD:
             return -999.0
-        effect = card.get("effect", "")
-        if effect not in (
-            "assign_to_ship_block_1",
-            "assign_to_ship_block_1_draw_1_discard_1",
-            "assign_to_ship_block_2",
-            "assign_to_ship_block_any",
-        ):
-            return -999.0
-        unshielded = len(player.unshielded_ships())
+        return EFFECT_HANDLERS[TYPE_SHIELD][card.effect_code].score(self, player, card)
+
+    def _score_assigned_shield(self, player, card, base):
+        unshielded = player.fleet.unshielded
         if unshielded <= 0:
             return -2.0
-        base = {
-            "assign_to_ship_block_1": 5.0,
-            "assign_to_ship_block_1_draw_1_discard_1": 5.8,
-            "assign_to_ship_block_2": 7.2,
-            "assign_to_ship_block_any": 8.0,
-        }.get(effect, 4.0)
         urgency = 1.8 if player.ship_count <= 3 else 0.0
         return base + min(unshielded, 3) * 0.7 + urgency
 
+    def _score_unplayable_shield(self, player, card):
+        # Reactive shields stay in hand; they are never played as the action.
+        return -999.0
+
     def _select_best_shield_card(self, player):
-        shields = [c for c in player.hand if c.get("type") == "shield"]
+        shields = player.hand.of_type(TYPE_SHIELD)
         if not shields:
             return None, -999.0
         scored = [(self._score_shield_card(player, c), c) for c in shields]
-        scored.sort(key=lambda x: (x[0], self._card_intrinsic_value(x[1])), reverse=True)
+        scored.sort(key=lambda x: (x[0], x[1].value), reverse=True)
         return scored[0][1], scored[0][0]
 
     def _select_best_special_card(self, player):
-        specials = [c for c in player.hand if c.get("type") == "special"]
+        specials = player.hand.of_type(TYPE_SPECIAL)
         if not specials:
             return None, -999.0
         scored = [(self._score_special_card(player, c), c) for c in specials]
-        scored.sort(key=lambda x: (x[0], self._card_intrinsic_value(x[1])), reverse=True)
+        scored.sort(key=lambda x: (x[0], x[1].value), reverse=True)
         return scored[0][1], scored[0][0]
 
     def play_one_special(self, player, card=None):
@@ -779,157 +1013,146 @@ class Game:
             card, score = self._select_best_special_card(player)
             if card is None or score <= 0:
                 return False
-        elif card not in player.hand or card.get("type") != "special":
+        elif card not in player.hand or card.type_code != TYPE_SPECIAL:
             return False
 
-        effect = card.get("effect", "")
+        effect = card.effect_code
         player.hand.remove(card)
-        if effect in ("add_1_ship_to_fleet", "take_extra_turn"):
+        if effect in (EFFECT_ADD_1_SHIP_TO_FLEET, EFFECT_TAKE_EXTRA_TURN):
             # One-time use specials are trashed when played.
             self.trash_pile.append(card)
         else:
             player.discard_pile.append(card)
 
-        if effect == "draw_3_keep_2_discard_1":
-            drawn = []
-            for _ in range(3):
-                before = len(player.hand)
-                player.draw_one()
-                if len(player.hand) > before:
-                    drawn.append(player.hand[-1])
-            if drawn:
-                to_discard = next(
-                    (c for c in drawn if c.get("type") in ("debris", "currency")),
-                    drawn[0],
-                )
-                if to_discard in player.hand:
-                    player.hand.remove(to_discard)
-                    player.discard_pile.append(to_discard)
-            self.log.append(f"  {player.name} plays 'Deep Space Recon' (drew 3, kept 2)")
-
-        elif effect == "retrieve_1_card_from_discard":
-            pool = [c for c in player.discard_pile if c is not card]
-            if pool:
-                rank = {"rocket": 0, "shield": 1, "special": 2, "currency": 3, "debris": 4}
-                retrieve = min(pool, key=lambda c: (rank.get(c.get("type", ""), 9), c.get("name", "")))
-                player.discard_pile.remove(retrieve)
-                player.hand.append(retrieve)
-                self.log.append(
-                    f"  {player.name} plays 'Salvage Operation' - retrieves '{retrieve['name']}'"
-                )
-            else:
-                self.log.append(f"  {player.name} plays 'Salvage Operation' (discard empty)")
-
-        elif effect == "negate_last_ship_loss_once":
-            player.last_stand = True
-            self.log.append(
-                f"  {player.name} plays 'Last Stand Protocol' - final ship protected!"
-            )
+        EFFECT_HANDLERS[TYPE_SPECIAL][effect].resolve(self, player, card)
+        return True
 
-        elif effect == "add_1_ship_to_fleet":
-            # Legacy fallback: normally this card deploys directly when bought.
-            player.fleet.append(Ship(starter_side=STARTER_SHIP_UNSHIELDED_SIDE))
-            self.log.append(
-                f"  {player.name} plays 'Reinforcement Shuttle' from hand (legacy) - "
-                f"fleet grows to {player.ship_count} ships!"
+    def _play_recon(self, player, card):
+        drawn = []
+        for _ in range(3):
+            before = len(player.hand)
+            player.draw_one()
+            if len(player.hand) > before:
+                drawn.append(player.hand[-1])
+        if drawn:
+            to_discard = next(
+                (c for c in drawn if c.type_code in (TYPE_DEBRIS, TYPE_CURRENCY)),
+                drawn[0],
             )
-
-        elif effect == "take_extra_turn":
-            player.extra_turn = True
-            self.log.append(f"  {player.name} plays 'Warp Drive' - extra turn queued!")
-
-        elif effect == "look_at_top3_any_market_rearrange":
-            top3 = self.abilities_pile[-3:] if len(self.abilities_pile) >= 3 else self.abilities_pile[:]
-            top3.sort(key=lambda c: self._card_cost(c), reverse=True)
-            for i, c in enumerate(top3):
-                self.abilities_pile[len(self.abilities_pile) - len(top3) + i] = c
-            self.log.append(f"  {player.name} plays 'Arms Dealer' - rearranged market deck")
-
-        elif effect == "trash_1_card_from_discard":
-            # Deck Purge can trash one card from either discard or hand.
-            candidates = []
-            for idx, c in enumerate(player.discard_pile):
-                candidates.append(("discard", idx, c))
-            for idx, c in enumerate(player.hand):
-                candidates.append(("hand", idx, c))
-
-            if candidates:
-                zone, idx, to_trash = min(
-                    candidates,
-                    key=lambda t: self._card_intrinsic_value(t[2]),
-                )
-                if zone == "discard":
-                    player.discard_pile.pop(idx)
-                else:
-                    player.hand.pop(idx)
-                self.trash_pile.append(to_trash)
-                self.log.append(
-                    f"  {player.name} plays 'Deck Purge' - trashes '{to_trash['name']}' from {zone}"
-                )
-            else:
-                self.log.append(f"  {player.name} plays 'Deck Purge' (no cards to trash)")
-
-        elif effect == "trash_1_card_from_discard_draw_1":
-            pool = [c for c in player.discard_pile if c is not card]
-            if pool:
-                to_trash = min(pool, key=self._card_intrinsic_value)
+            if to_discard in player.hand:
+                player.hand.remove(to_discard)
+                player.discard_pile.append(to_discard)
+        if self.log_level >= LOG_FULL:
+            self._emit(EVENT_SPECIAL, player.seat, card, None, None)
+
+    def _play_salvage(self, player, card):
+        pool = _without_one(player.discard_pile, card)
+        if pool:
+            rank = {TYPE_ROCKET: 0, TYPE_SHIELD: 1, TYPE_SPECIAL: 2, TYPE_CURRENCY: 3, TYPE_DEBRIS: 4}
+            retrieve = min(pool, key=lambda c: (rank.get(c.type_code, 9), c.name))
+            player.discard_pile.remove(retrieve)
+            player.hand.append(retrieve)
+            if self.log_level >= LOG_FULL:
+                self._emit(EVENT_SPECIAL, player.seat, card, retrieve, None)
+        elif self.log_level >= LOG_FULL:
+            self._emit(EVENT_SPECIAL, player.seat, card, None, None)
+
+    def _play_last_stand(self, player, card):
+        player.last_stand = True
+        if self.log_level >= LOG_FULL:
+            self._emit(EVENT_SPECIAL, player.seat, card, None, None)
+
+    def _play_add_ship(self, player, card):
+        # Legacy fallback: normally this card deploys directly when bought.
+        player.fleet.append(Ship(starter_side=STARTER_SHIP_UNSHIELDED_SIDE))
+        if self.log_level >= LOG_FULL:
+            self._emit(EVENT_SPECIAL, player.seat, card, None, player.ship_count)
+
+    def _play_extra_turn(self, player, card):
+        player.extra_turn = True
+        if self.log_level >= LOG_FULL:
+            self._emit(EVENT_SPECIAL, player.seat, card, None, None)
+
+    def _play_arms_dealer(self, player, card):
+        top3 = self.abilities_pile.top(3)
+        top3.sort(key=_by_cost, reverse=True)
+        self.abilities_pile.replace_top(top3)
+        if self.log_level >= LOG_FULL:
+            self._emit(EVENT_SPECIAL, player.seat, card, None, None)
+
+    def _play_deck_purge(self, player, card):
+        # Deck Purge can trash one card from either discard or hand.
+        zone, to_trash = _lowest_value("discard", player.discard_pile, "hand", player.hand)
+        if to_trash is not None:
+            if zone == "discard":
                 player.discard_pile.remove(to_trash)
-                self.trash_pile.append(to_trash)
-                self.log.append(
-                    f"  {player.name} plays 'Deep Clean' - trashes '{to_trash['name']}' and draws 1"
-                )
             else:
-                self.log.append(f"  {player.name} plays 'Deep Clean' (discard empty, draws 1)")
-            player.draw_one()
-
-        elif effect in ("skip_next_turn", "skip_next_buy"):
-            player.skip_next_turn = True
-            self.log.append(
-                f"  {player.name} applies a skip effect and will skip their next turn"
-            )
-
-        else:
-            self.log.append(f"  {player.name} plays '{card['name']}' (no effect handler)")
-
-        return True
+                player.hand.remove(to_trash)
+            self.trash_pile.append(to_trash)
+            if self.log_level >= LOG_FULL:
+                self._emit(EVENT_SPECIAL, player.seat, card, to_trash, zone)
+        elif self.log_level >= LOG_FULL:
+            self._emit(EVENT_SPECIAL, player.seat, card, None, None)
+
+    def _play_deep_clean(self, player, card):
+        pool = _without_one(player.discard_pile, card)
+        if pool:
+            to_trash = min(pool, key=_by_value)
+            player.discard_pile.remove(to_trash)
+            self.trash_pile.append(to_trash)
+            if self.log_level >= LOG_FULL:
+                self._emit(EVENT_SPECIAL, player.seat, card, to_trash, None)
+        elif self.log_level >= LOG_FULL:
+            self._emit(EVENT_SPECIAL, player.seat, card, None, None)
+        player.draw_one()
+
+    def _play_self_skip(self, player, card):
+        player.skip_next_turn = True
+        if self.log_level >= LOG_FULL:
+            self._emit(EVENT_SPECIAL, player.seat, card, None, None)
+
+    def _play_plain_special(self, player, card):
+        if self.log_level >= LOG_FULL:
+            self._emit(EVENT_SPECIAL, player.seat, card, None, None)
 
     def play_one_shield(self, player, card=None):
         if card is None:
             card, score = self._select_best_shield_card(player)
             if card is None or score <= 0:
                 return False
-        elif card not in player.hand or card.get("type") != "shield":
+        elif card not in player.hand or card.type_code != TYPE_SHIELD:
             return False
 
         player.hand.remove(card)
-        targets = player.unshielded_ships()
-        if targets:
-            targets[0].assign_shield(card)
-            self.log.append(
-                f"  {player.name} assigns '{card['name']}' "
-                f"({len(player.shielded_ships())}/{player.ship_count} shielded)"
-            )
-            if card.get("effect") == "assign_to_ship_block_1_draw_1_discard_1":
-                before = len(player.hand)
-                player.draw_one()
-                drew = len(player.hand) > before
-                discarded_name = "none"
-                if player.hand:
-                    to_discard = min(player.hand, key=self._card_intrinsic_value)
-                    player.hand.remove(to_discard)
-                    player.discard_pile.append(to_discard)
-                    discarded_name = to_discard["name"]
-                draw_note = "draws 1" if drew else "draws 0"
-                self.log.append(
-                    f"    -> Decoy Drone resolves immediately: {draw_note}, discards '{discarded_name}'"
+        target_ship = player.fleet.first_unshielded()
+        if target_ship is not None:
+            target_ship.assign_shield(card)
+            if self.log_level >= LOG_FULL:
+                self._emit(
+                    EVENT_ASSIGN_SHIELD, player.seat, card, player.fleet.shielded, player.ship_count
                 )
+            on_assign = EFFECT_HANDLERS[TYPE_SHIELD][card.effect_code].resolve
+            if on_assign is not None:
+                on_assign(self, player, card)
         else:
             player.discard_pile.append(card)
-            self.log.append(
-                f"  {player.name} discards '{card['name']}' (no unshielded ships)"
-            )
+            if self.log_level >= LOG_FULL:
+                self._emit(EVENT_SHIELD_DISCARDED, player.seat, card)
         return True
 
+    def _assign_decoy(self, player, card):
+        """Decoy Drone: once assigned, draw 1 then discard the lowest-value card."""
+        before = len(player.hand)
+        player.draw_one()
+        drew = len(player.hand) > before
+        discarded = None
+        if player.hand:
+            discarded = min(player.hand, key=_by_value)
+            player.hand.remove(discarded)
+            player.discard_pile.append(discarded)
+        if self.log_level >= LOG_FULL:
+            self._emit(EVENT_DECOY_RESOLVE, player.seat, drew, discarded)
+
     def play_one_rocket(self, player, card=None):
         alive_opponents = self._alive_opponents(player)
         if not alive_opponents:
@@ -939,115 +1162,111 @@ class Game:
             card, score = self._select_best_rocket_card(player)
             if card is None or score <= 0:
                 return False
-        elif card not in player.hand or card.get("type") != "rocket":
+        elif card not in player.hand or card.type_code != TYPE_ROCKET:
             return False
 
-        effect = card.get("effect", "")
+        effect = card.effect_code
         player.hand.remove(card)
         player.discard_pile.append(card)
+        self.rockets_fired += 1
+        self._effect_in_play = effect
 
-        if effect == "each_opponent_blocks_or_loses_ship":
-            self.log.append(f"  {player.name} fires '{card['name']}' at ALL opponents!")
-            for opp in alive_opponents:
-                self._fire_at(player, opp, effect)
-
-        elif effect in ("destroy_up_to_2_ships", "destory_up_to_2_ships"):
-            self.log.append(f"  {player.name} fires '{card['name']}' (salvo - up to 2 hits)")
-            target = self._pick_best_target(player, alive_opponents, "destroy_1_ship")
-            self._fire_at(player, target, "destroy_1_ship")
-            alive_opponents = [p for p in alive_opponents if p.is_alive()]
-            if alive_opponents:
-                target2 = self._pick_best_target(player, alive_opponents, "destroy_1_ship")
-                self._fire_at(player, target2, "destroy_1_ship")
-
-        elif effect == "destroy_up_to_2_ships_then_lose_one_1_bank_currency":
-            self.log.append(f"  {player.name} fires '{card['name']}' (salvo+ - up to 2 hits)")
-            target = self._pick_best_target(player, alive_opponents, "destroy_1_ship")
-            self._fire_at(player, target, "destroy_1_ship")
-            alive_opponents = [p for p in alive_opponents if p.is_alive()]
-            if alive_opponents:
-                target2 = self._pick_best_target(player, alive_opponents, "destroy_1_ship")
-                self._fire_at(player, target2, "destroy_1_ship")
-            if player.bank_pile:
-                spent_bank = player.bank_pile.pop()
-                player.discard_pile.append(spent_bank)
-                self.log.append(
-                    f"    -> Salvo drawback: {player.name} loses 1 bank currency"
-                )
-            else:
-                self.log.append(
-                    f"    -> Salvo drawback: {player.name} has no bank currency to lose"
-                )
-
-        elif effect in ("skip_next_turn", "skip_next_buy"):
-            target = self._pick_best_target(player, alive_opponents, "destroy_1_ship")
-            if target is not None:
-                target.skip_next_turn = True
-                self.attack_counts[target.name] += 1
-                self.log.append(
-                    f"  {player.name} forces {target.name} to skip their next turn"
-                )
-
-        elif effect == "each_opponent_blocks_2_or_loses_2_ships_and_you_skip_next_turn":
-            self.log.append(f"  {player.name} fires '{card['name']}' at ALL opponents (2 hits each)")
-            for opp in list(alive_opponents):
-                if not opp.is_alive():
-                    continue
-                self._fire_at(player, opp, "destroy_1_ship")
-                if opp.is_alive():
-                    self._fire_at(player, opp, "destroy_1_ship")
-            player.skip_next_turn = True
-            self.log.append(f"    -> Overload drawback: {player.name} will skip their next turn")
-
-        elif effect == "destroy_1_ship_then_discard_1_random_card_from_hand":
-            target = self._pick_best_target(player, alive_opponents, "destroy_1_ship")
-            self.log.append(f"  {player.name} fires '{card['name']}' at {target.name}")
-            self._fire_at(player, target, "destroy_1_ship")
-            if player.hand:
-                discarded = random.choice(player.hand)
-                player.hand.remove(discarded)
-                player.discard_pile.append(discarded)
-                self.log.append(
-                    f"    -> Shatter drawback: {player.name} discards random card '{discarded['name']}'"
-                )
-            else:
-                self.log.append(
-                    f"    -> Shatter drawback: {player.name} has no card in hand to discard"
-                )
-
-        elif effect == "strip_all_shields_one_opponent":
-            target = self._pick_best_target(player, alive_opponents, effect)
-            self.log.append(f"  {player.name} fires EMP at {target.name}")
-            for ship in target.fleet:
-                ship.strip_shield()
-            self.attack_counts[target.name] += 1
-            self.log.append(
-                f"    -> All shields stripped from {target.name}! "
-                f"({target.ship_count} unshielded ships remain)"
-            )
-
-        elif effect == "destroy_1_weakest_ship":
-            target = self._pick_best_target(player, alive_opponents, "destroy_1_ship")
-            self.log.append(f"  {player.name} fires '{card['name']}' at {target.name}")
-            self._fire_at(player, target, "destroy_1_ship")
-
-        else:
-            target = self._pick_best_target(player, alive_opponents, effect)
-            self.log.append(f"  {player.name} fires '{card['name']}' at {target.name}")
-            self._fire_at(player, target, effect)
-
+        EFFECT_HANDLERS[TYPE_ROCKET][effect].resolve(self, player, card, alive_opponents)
         return True
 
-    def _market_status_text(self):
-        slots = []
-        for i, card in enumerate(self.market_display, start=1):
-            if card is None:
-                slots.append(f"{i}: empty")
-            else:
-                slots.append(f"{i}: {card['name']} (${self._card_cost(card)})")
-        return " | ".join(slots)
+    def _fire_barrage(self, player, card, alive_opponents):
+        if self.log_level >= LOG_FULL:
+            self._emit(EVENT_FIRE_ALL, player.seat, card)
+        for opp in alive_opponents:
+            self._fire_at(player, opp, card.effect_code)
+
+    def _fire_twin_salvo(self, player, card, alive_opponents):
+        if self.log_level >= LOG_FULL:
+            self._emit(EVENT_FIRE_SALVO, player.seat, card)
+        self._fire_two_hits(player, alive_opponents)
+
+    def _fire_salvo(self, player, card, alive_opponents):
+        if self.log_level >= LOG_FULL:
+            self._emit(EVENT_FIRE_SALVO_PLUS, player.seat, card)
+        self._fire_two_hits(player, alive_opponents)
+        if player.bank_pile:
+            spent_bank = player.bank_pile.pop()
+            player.discard_pile.append(spent_bank)
+            if self.log_level >= LOG_FULL:
+                self._emit(EVENT_SALVO_DRAWBACK, player.seat, True)
+        elif self.log_level >= LOG_FULL:
+            self._emit(EVENT_SALVO_DRAWBACK, player.seat, False)
+
+    def _fire_two_hits(self, player, alive_opponents):
+        target = self._pick_best_target(player, alive_opponents, EFFECT_DESTROY_1_SHIP)
+        self._fire_at(player, target, EFFECT_DESTROY_1_SHIP)
+        alive_opponents = [p for p in alive_opponents if p.is_alive()]
+        if alive_opponents:
+            target2 = self._pick_best_target(player, alive_opponents, EFFECT_DESTROY_1_SHIP)
+            self._fire_at(player, target2, EFFECT_DESTROY_1_SHIP)
+
+    def _fire_force_skip(self, player, card, alive_opponents):
+        target = self._pick_best_target(player, alive_opponents, EFFECT_DESTROY_1_SHIP)
+        if target is not None:
+            target.skip_next_turn = True
+            self.attack_counts[target.name] += 1
+            if self.log_level >= LOG_FULL:
+                self._emit(EVENT_FORCE_SKIP, player.seat, target.seat)
+
+    def _fire_overload(self, player, card, alive_opponents):
+        if self.log_level >= LOG_FULL:
+            self._emit(EVENT_FIRE_OVERLOAD, player.seat, card)
+        for opp in list(alive_opponents):
+            if not opp.is_alive():
+                continue
+            self._fire_at(player, opp, EFFECT_DESTROY_1_SHIP)
+            if opp.is_alive():
+                self._fire_at(player, opp, EFFECT_DESTROY_1_SHIP)
+        player.skip_next_turn = True
+        if self.log_level >= LOG_FULL:
+            self._emit(EVENT_OVERLOAD_DRAWBACK, player.seat)
+
+    def _fire_shatter(self, player, card, alive_opponents):
+        target = self._pick_best_target(player, alive_opponents, EFFECT_DESTROY_1_SHIP)
+        if self.log_level >= LOG_FULL:
+            self._emit(EVENT_FIRE, player.seat, card, target.seat)
+        self._fire_at(player, target, EFFECT_DESTROY_1_SHIP)
+        if player.hand:
+            discarded = self.rng.choice(player.hand)
+            player.hand.remove(discarded)
+            player.discard_pile.append(discarded)
+            if self.log_level >= LOG_FULL:
+                self._emit(EVENT_SHATTER_DRAWBACK, player.seat, discarded)
+        elif self.log_level >= LOG_FULL:
+            self._emit(EVENT_SHATTER_DRAWBACK, player.seat, None)
+
+    def _fire_emp(self, player, card, alive_opponents):
+        target = self._pick_best_target(player, alive_opponents, card.effect_code)
+        if self.log_level >= LOG_FULL:
+            self._emit(EVENT_FIRE_EMP, player.seat, target.seat)
+        for ship in target.fleet:
+            ship.strip_shield()
+        self.attack_counts[target.name] += 1
+        if self.log_level >= LOG_FULL:
+            self._emit(EVENT_SHIELDS_STRIPPED, target.seat, target.ship_count)
+
+    def _fire_seeking(self, player, card, alive_opponents):
+        target = self._pick_best_target(player, alive_opponents, EFFECT_DESTROY_1_SHIP)
+        if self.log_level >= LOG_FULL:
+            self._emit(EVENT_FIRE, player.seat, card, target.seat)
+        self._fire_at(player, target, EFFECT_DESTROY_1_SHIP)
+
+    def _fire_single(self, player, card, alive_opponents):
+        effect = card.effect_code
+        target = self._pick_best_target(player, alive_opponents, effect)
+        if self.log_level >= LOG_FULL:
+            self._emit(EVENT_FIRE, player.seat, card, target.seat)
+        self._fire_at(player, target, effect)
 
     def _choose_action(self, player):
+        # A new decision: drop the previous turn's hit estimates. The ones
+        # made here stay valid for the targeting that resolves the action.
+        self._hit_values = {}
         actions = []
 
         buy_slot, buy_card, buy_score = self.pick_buy_option(player)
@@ -1076,72 +1295,125 @@ class Game:
             key=lambda a: (
                 a[1],
                 priority[a[0]],
-                self._card_cost(a[3]) if a[3] is not None else 0,
+                a[3].cost if a[3] is not None else 0,
             ),
         )
         return best
 
-    def play_turn(self, player):
+    def _draw_phase(self, player):
         player.draw_to_hand_size()
-        self.log.append(
-            f"  {player.name} draws to {len(player.hand)} cards "
-            f"(deck:{len(player.draw_pile)} discard:{len(player.discard_pile)} bank:{player.bank})"
-        )
+        if self.log_level >= LOG_FULL:
+            self._emit(
+                EVENT_DRAW,
+                player.seat,
+                len(player.hand),
+                len(player.draw_pile),
+                len(player.discard_pile),
+                player.bank,
+            )
 
+    def _bank_phase(self, player):
         banked, scout_draws = player.bank_currency_from_hand()
-        if banked:
-            draw_note = f" | scout draws: {scout_draws}" if scout_draws else ""
-            self.log.append(
-                f"  {player.name} banks {banked} currency card(s) [bank: {player.bank}{draw_note}]"
-            )
+        if banked and self.log_level >= LOG_FULL:
+            self._emit(EVENT_BANK, player.seat, banked, player.bank, scout_draws)
 
+    def _debris_phase(self, player):
         debris_discarded = player.discard_debris_from_hand()
-        if debris_discarded:
-            self.log.append(
-                f"  {player.name} discards {debris_discarded} debris card(s)"
-            )
+        if debris_discarded and self.log_level >= LOG_FULL:
+            self._emit(EVENT_DEBRIS, player.seat, debris_discarded)
 
-        self.log.append(f"  Market: {self._market_status_text()}")
+    def _market_phase(self):
+        if self.log_level >= LOG_FULL:
+            self._emit(EVENT_MARKET, tuple(self.market_display))
 
+    def play_turn(self, player):
+        self._draw_phase(player)
+        self._bank_phase(player)
+        self._debris_phase(player)
+        self._market_phase()
         action, score, slot_idx, chosen_card = self._choose_action(player)
+        self._resolve_action(player, action, score, slot_idx, chosen_card)
+        if self.recorder is not None:
+            self.recorder.record_turn(self, player)
+
+    def _play_turn_timed(self, player):
+        """play_turn with every phase timed into self.phase_times."""
+        clock = perf_counter_ns
+        t0 = clock()
+        self._draw_phase(player)
+        t1 = clock()
+        self._bank_phase(player)
+        t2 = clock()
+        self._debris_phase(player)
+        t3 = clock()
+        self._market_phase()
+        t4 = clock()
+        action, score, slot_idx, chosen_card = self._choose_action(player)
+        t5 = clock()
+        self._resolve_action(player, action, score, slot_idx, chosen_card)
+        t6 = clock()
+        self.phase_times.add(action, (t1 - t0, t2 - t1, t3 - t2, t4 - t3, t5 - t4, t6 - t5))
+        if self.recorder is not None:
+            self.recorder.record_turn(self, player)
+
+    def _resolve_action(self, player, action, score, slot_idx, chosen_card):
         if action == "buy":
-            self.log.append(
-                f"  {player.name} chooses BUY '{chosen_card['name']}' "
-                f"(score {score:.1f})"
-            )
+            if self.log_level >= LOG_FULL:
+                self._emit(EVENT_CHOOSE_BUY, player.seat, chosen_card, score)
             self.buy_from_market(player, slot_idx)
-        elif action == "rocket":
-            self.log.append(
-                f"  {player.name} chooses ROCKET '{chosen_card['name']}' "
-                f"(score {score:.1f})"
-            )
-            self.play_one_rocket(player, chosen_card)
+            return
+        if action not in ("rocket", "shield", "special"):
+            if self.log_level >= LOG_FULL:
+                self._emit(EVENT_PASS, player.seat)
+            return
+
+        telemetry = self.telemetry
+        if telemetry is not None:
+            start = perf_counter_ns()
+        if action == "rocket":
+            if self.log_level >= LOG_FULL:
+                self._emit(EVENT_CHOOSE_ROCKET, player.seat, chosen_card, score)
+            resolved = self.play_one_rocket(player, chosen_card)
         elif action == "shield":
-            self.log.append(
-                f"  {player.name} chooses SHIELD '{chosen_card['name']}' "
-                f"(score {score:.1f})"
-            )
-            self.play_one_shield(player, chosen_card)
-        elif action == "special":
-            self.log.append(
-                f"  {player.name} chooses SPECIAL '{chosen_card['name']}' "
-                f"(score {score:.1f})"
-            )
-            self.play_one_special(player, chosen_card)
+            if self.log_level >= LOG_FULL:
+                self._emit(EVENT_CHOOSE_SHIELD, player.seat, chosen_card, score)
+            resolved = self.play_one_shield(player, chosen_card)
         else:
-            self.log.append(f"  {player.name} passes (no valid action)")
+            if self.log_level >= LOG_FULL:
+                self._emit(EVENT_CHOOSE_SPECIAL, player.seat, chosen_card, score)
+            resolved = self.play_one_special(player, chosen_card)
+        if telemetry is not None:
+            effect = chosen_card.effect_code
+            telemetry.ns[effect] += perf_counter_ns() - start
+            telemetry.chosen[effect] += 1
+            if resolved:
+                telemetry.resolved[effect] += 1
 
     def run(self, max_turns=200):
-        self.log.append("=== Game Start ===")
-        for p in self.players:
-            self.log.append(f"  {p}")
+        self.max_turns = max_turns
+        # Chosen once per game, so untimed games never check for a timer.
+        play_turn = self.play_turn if self.phase_times is None else self._play_turn_timed
+        if self.log_level >= LOG_SUMMARY:
+            self._emit(EVENT_GAME_START)
+            for p in self.players:
+                self._emit(
+                    EVENT_ROSTER,
+                    p.seat,
+                    p.ship_count,
+                    p.fleet.shielded,
+                    len(p.hand),
+                    p.bank,
+                    len(p.draw_pile),
+                    len(p.discard_pile),
+                )
 
         while True:
             self.turn_number += 1
             self.attack_counts = {p.name: 0 for p in self.players}
             self.ships_destroyed_this_round = 0
             self.ship_hits_this_round = 0
-            self.log.append(f"\n-- Turn {self.turn_number} --")
+            if self.log_level >= LOG_FULL:
+                self._emit(EVENT_TURN_START, self.turn_number)
 
             for player in list(self.players):
                 if not player.is_alive():
@@ -1150,16 +1422,19 @@ class Game:
                 alive_before_turn = [p for p in self.players if p.is_alive()]
                 if player.skip_next_turn:
                     player.skip_next_turn = False
-                    self.log.append(f"  {player.name} skips this turn.")
+                    if self.log_level >= LOG_FULL:
+                        self._emit(EVENT_SKIP_TURN, player.seat)
                 else:
-                    self.play_turn(player)
+                    play_turn(player)
 
                 alive = [p for p in self.players if p.is_alive()]
                 if len(alive) == 1:
-                    self.log.append(f"\nWinner: {alive[0].name} on turn {self.turn_number}.")
+                    if self.log_level >= LOG_SUMMARY:
+                        self._emit(EVENT_WINNER, alive[0].seat, self.turn_number)
                     return alive[0].name
                 if not alive:
-                    self.log.append(f"\nMutual destruction on turn {self.turn_number}.")
+                    if self.log_level >= LOG_SUMMARY:
+                        self._emit(EVENT_MUTUAL_DESTRUCTION, self.turn_number)
                     return self._resolve_draw_by_bank(alive_before_turn)
 
                 alive_before_extra = [p for p in self.players if p.is_alive()]
@@ -1167,20 +1442,22 @@ class Game:
                     player.extra_turn = False
                     if player.skip_next_turn:
                         player.skip_next_turn = False
-                        self.log.append(
-                            f"  * {player.name} loses their extra turn (skip_next_turn)."
-                        )
+                        if self.log_level >= LOG_FULL:
+                            self._emit(EVENT_EXTRA_TURN_LOST, player.seat)
                     else:
-                        self.log.append(f"  * {player.name} takes an extra turn (Warp Drive)!")
+                        if self.log_level >= LOG_FULL:
+                            self._emit(EVENT_EXTRA_TURN, player.seat)
                         alive_before_extra = [p for p in self.players if p.is_alive()]
-                        self.play_turn(player)
+                        play_turn(player)
 
                 alive = [p for p in self.players if p.is_alive()]
                 if len(alive) == 1:
-                    self.log.append(f"\nWinner: {alive[0].name} on turn {self.turn_number}.")
+                    if self.log_level >= LOG_SUMMARY:
+                        self._emit(EVENT_WINNER, alive[0].seat, self.turn_number)
                     return alive[0].name
                 if not alive:
-                    self.log.append(f"\nMutual destruction on turn {self.turn_number}.")
+                    if self.log_level >= LOG_SUMMARY:
+                        self._emit(EVENT_MUTUAL_DESTRUCTION, self.turn_number)
                     return self._resolve_draw_by_bank(alive_before_extra)
 
             # End-of-round duel pressure:
@@ -1192,20 +1469,109 @@ class Game:
                 self._apply_unavoidable_ship_wreckage(alive)
                 alive = [p for p in self.players if p.is_alive()]
                 if len(alive) == 1:
-                    self.log.append(f"\nWinner: {alive[0].name} on turn {self.turn_number}.")
+                    if self.log_level >= LOG_SUMMARY:
+                        self._emit(EVENT_WINNER, alive[0].seat, self.turn_number)
                     return alive[0].name
                 if not alive:
-                    self.log.append(f"\nMutual destruction on turn {self.turn_number}.")
+                    if self.log_level >= LOG_SUMMARY:
+                        self._emit(EVENT_MUTUAL_DESTRUCTION, self.turn_number)
                     return self._resolve_draw_by_bank(duel_before_wreckage)
 
+            if self.recorder is not None:
+                self.recorder.record_round(self)
+
             if self.turn_number >= max_turns:
+                self.hit_turn_limit = True
                 alive = [p for p in self.players if p.is_alive()]
                 if not alive:
-                    self.log.append(f"\nNo players alive at turn limit ({max_turns}).")
+                    if self.log_level >= LOG_SUMMARY:
+                        self._emit(EVENT_TURN_LIMIT_NO_PLAYERS, max_turns)
                     return self._resolve_draw_by_bank(self.players)
                 winner = max(alive, key=lambda p: p.ship_count)
-                self.log.append(
-                    f"\nTurn limit reached ({max_turns}). "
-                    f"{winner.name} wins with {winner.ship_count} ships."
-                )
+                if self.log_level >= LOG_SUMMARY:
+                    self._emit(EVENT_TURN_LIMIT, max_turns, winner.seat, winner.ship_count)
                 return winner.name
+
+
+class EffectHandler:
+    """
+    What the engine does with cards of one (type, effect) pairing. Game
+    methods are stored unbound and called with the game first.
+
+    resolve  rockets: (game, player, card, alive_opponents) fires it;
+             specials: (game, player, card) plays it;
+             shields: (game, player, card) once assigned, or None
+    score    value of playing it now, same arguments as resolve
+    react    reactive shields: (game, defender, card) after blocking, or None
+
+    A card's intrinsic value is not here: Card.value holds it, computed by
+    effects.intrinsic_value when the catalog loads.
+    """
+
+    __slots__ = ("resolve", "score", "react")
+
+    def __init__(self, resolve, score, react):
+        self.resolve = resolve
+        self.score = score
+        self.react = react
+
+
+def _assigned_shield_scorer(base):
+    def score(game, player, card):
+        return game._score_assigned_shield(player, card, base)
+    return score
+
+
+# (resolve, score, react) per effect; effects not listed use the type default.
+_ROCKET_HANDLERS = {
+    EFFECT_EACH_OPPONENT_BLOCKS_OR_LOSES_SHIP: (Game._fire_barrage, Game._score_barrage, None),
+    EFFECT_DESTROY_UP_TO_2_SHIPS: (Game._fire_twin_salvo, Game._score_twin_salvo, None),
+    EFFECT_DESTROY_UP_TO_2_SHIPS_THEN_LOSE_1_BANK: (Game._fire_salvo, Game._score_salvo, None),
+    EFFECT_SKIP_NEXT_TURN: (Game._fire_force_skip, Game._score_force_skip, None),
+    EFFECT_SKIP_NEXT_BUY: (Game._fire_force_skip, Game._score_force_skip, None),
+    EFFECT_EACH_OPPONENT_BLOCKS_2_AND_SKIP: (Game._fire_overload, Game._score_overload, None),
+    EFFECT_DESTROY_1_SHIP_THEN_DISCARD_1_RANDOM: (Game._fire_shatter, Game._score_shatter, None),
+    EFFECT_STRIP_ALL_SHIELDS_ONE_OPPONENT: (Game._fire_emp, Game._score_emp, None),
+    EFFECT_DESTROY_1_WEAKEST_SHIP: (Game._fire_seeking, Game._score_seeking, None),
+}
+_SHIELD_HANDLERS = {
+    EFFECT_ASSIGN_BLOCK_1: (None, _assigned_shield_scorer(5.0), None),
+    EFFECT_ASSIGN_BLOCK_1_DRAW_1_DISCARD_1: (Game._assign_decoy, _assigned_shield_scorer(5.8), None),
+    EFFECT_ASSIGN_BLOCK_2: (None, _assigned_shield_scorer(7.2), None),
+    EFFECT_ASSIGN_BLOCK_ANY: (None, _assigned_shield_scorer(8.0), None),
+    EFFECT_REACTIVE_BLOCK_THEN_TRASH_1: (None, Game._score_unplayable_shield, Game._react_aegis),
+}
+_SPECIAL_HANDLERS = {
+    EFFECT_DRAW_3_KEEP_2_DISCARD_1: (Game._play_recon, Game._score_recon, None),
+    EFFECT_RETRIEVE_1_FROM_DISCARD: (Game._play_salvage, Game._score_salvage, None),
+    EFFECT_LOOK_AT_TOP3_REARRANGE: (Game._play_arms_dealer, Game._score_arms_dealer, None),
+    EFFECT_NEGATE_LAST_SHIP_LOSS: (Game._play_last_stand, Game._score_last_stand, None),
+    EFFECT_ADD_1_SHIP_TO_FLEET: (Game._play_add_ship, Game._score_add_ship, None),
+    EFFECT_TAKE_EXTRA_TURN: (Game._play_extra_turn, Game._score_extra_turn, None),
+    EFFECT_TRASH_1_FROM_DISCARD: (Game._play_deck_purge, Game._score_deck_purge, None),
+    EFFECT_TRASH_1_FROM_DISCARD_DRAW_1: (Game._play_deep_clean, Game._score_deep_clean, None),
+    EFFECT_SKIP_NEXT_TURN: (Game._play_self_skip, Game._score_self_skip, None),
+    EFFECT_SKIP_NEXT_BUY: (Game._play_self_skip, Game._score_self_skip, None),
+}
+_TYPE_HANDLERS = {
+    TYPE_ROCKET: (_ROCKET_HANDLERS, (Game._fire_single, Game._score_single_rocket, None)),
+    TYPE_SHIELD: (_SHIELD_HANDLERS, (None, Game._score_unplayable_shield, None)),
+    TYPE_SPECIAL: (_SPECIAL_HANDLERS, (Game._play_plain_special, Game._score_plain_special, None)),
+}
+
+
+def _build_effect_handlers():
+    table = []
+    for type_code in range(NUM_CARD_TYPES):
+        handlers, default = _TYPE_HANDLERS.get(type_code, ({}, (None, None, None)))
+        table.append(tuple(
+            EffectHandler(*handlers.get(effect, default))
+            for effect in range(NUM_EFFECTS)
+        ))
+    return tuple(table)
+
+
+# EFFECT_HANDLERS[card.type_code][card.effect_code]: two index lookups,
+# however many effects exist. Every slot is filled (unlisted effects get
+# their type's default), and compile_cards only admits effects.CARD_EFFECTS.
+EFFECT_HANDLERS = _build_effect_handlers()
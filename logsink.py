@@ -0,0 +1,119 @@
+import gzip
+import io
+import os
+from contextlib import contextmanager
+
+from events import render_event
+
+ARCHIVE_SUFFIX = ".log.gz"
+INDEX_SUFFIX = ".idx"
+
+
+class LogWriter:
+    """
+    Game subscriber that renders each event as it happens and writes it as
+    one line to a text stream, so the log is never held in memory.
+    """
+
+    def __init__(self, game, stream):
+        self.names = [p.name for p in game.players]
+        self.stream = stream
+        game.subscribe(self)
+
+    def __call__(self, event):
+        self.stream.write(render_event(event, self.names))
+        self.stream.write("\n")
+
+
+def open_game_log(path, game, compresslevel=6):
+    """
+    Streams `game`'s log into a gzip text file at `path` while it runs.
+    Returns the open file; close it once the game is over.
+    """
+    stream = gzip.open(path, "wt", encoding="utf-8", compresslevel=compresslevel)
+    LogWriter(game, stream)
+    return stream
+
+
+def index_path(path):
+    return path + INDEX_SUFFIX
+
+
+class LogArchive:
+    """
+    Many game logs in one file. Each game is a separate gzip member, so the
+    file as a whole is still a valid .gz (zcat prints every log in order),
+    and a tab-separated index of "key offset length" lines next to it lets
+    read_archived_log() seek straight to a single game.
+
+    Members and index lines are flushed as each game finishes, so an
+    archive left open by a killed process is still readable up to its last
+    complete game.
+    """
+
+    def __init__(self, path, compresslevel=6):
+        self.path = path
+        self.compresslevel = compresslevel
+        self._file = open(path, "ab")
+        self._index = open(index_path(path), "a", encoding="utf-8")
+
+    @contextmanager
+    def record(self, game, key):
+        """Streams `game`'s log into a new member while the block runs."""
+        start = self._file.seek(0, os.SEEK_END)
+        member = gzip.GzipFile(fileobj=self._file, mode="wb", compresslevel=self.compresslevel, mtime=0)
+        stream = io.TextIOWrapper(member, encoding="utf-8")
+        LogWriter(game, stream)
+        try:
+            yield game
+        finally:
+            # Closing the wrapper finishes the member but not the archive file.
+            stream.close()
+            self._file.flush()
+            self._index.write(f"{key}\t{start}\t{self._file.tell() - start}\n")
+            self._index.flush()
+
+    def close(self):
+        self._file.close()
+        self._index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_index(path):
+    """{key: (offset, length)} for an archive; keys are strings."""
+    index = {}
+    try:
+        with open(index_path(path), encoding="utf-8") as f:
+            for line in f:
+                key, offset, length = line.rstrip("\n").split("\t")
+                index[key] = (int(offset), int(length))
+    except FileNotFoundError:
+        pass
+    return index
+
+
+def read_archived_log(path, key, index=None):
+    """Log text of one game in an archive, or None if `key` isn't in it."""
+    index = read_index(path) if index is None else index
+    entry = index.get(str(key))
+    if entry is None:
+        return None
+    offset, length = entry
+    with open(path, "rb") as f:
+        f.seek(offset)
+        return gzip.decompress(f.read(length)).decode("utf-8")
+
+
+def find_archived_log(log_dir, key):
+    """Searches every archive in `log_dir` (e.g. one per worker) for `key`."""
+    for name in sorted(os.listdir(log_dir)):
+        if name.endswith(ARCHIVE_SUFFIX):
+            text = read_archived_log(os.path.join(log_dir, name), key)
+            if text is not None:
+                return text
+    return None
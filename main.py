@@ -1,10 +1,54 @@
-from cards import load_all_decks
+import time
+
+_start = time.perf_counter()
+
+import argparse
+import sys
+
+from cards import load_catalog
 from game import Game
+from logsink import LogWriter, open_game_log
+
+PLAYER_NAMES = ["Alice", "Bob", "Carol", "Jack", "John"]
+
+parser = argparse.ArgumentParser(description="Play one Space Goats game and print its log.")
+parser.add_argument("--seed", type=int, help="game seed (e.g. one recorded by simulation.py)")
+parser.add_argument(
+    "--players",
+    type=int,
+    default=len(PLAYER_NAMES),
+    choices=range(2, len(PLAYER_NAMES) + 1),
+    help="number of players (default: %(default)s)",
+)
+parser.add_argument("--log", metavar="PATH", help="write the game log gzip-compressed to PATH instead of stdout")
+parser.add_argument(
+    "--timing",
+    action="store_true",
+    help="report startup time (imports + catalog load) on stderr",
+)
+args = parser.parse_args()
+
+catalog = load_catalog()
+startup_ms = (time.perf_counter() - _start) * 1000
 
-starter, abilities = load_all_decks()
+# The log is streamed line by line as the game runs, never held in memory.
+game = Game(
+    PLAYER_NAMES[:args.players], catalog.starter_deck, catalog.market_pile,
+    seed=args.seed, keep_events=False,
+)
+if args.log:
+    with open_game_log(args.log, game):
+        winner = game.run()
+else:
+    LogWriter(game, sys.stdout)
+    winner = game.run()
 
-game = Game(["Alice", "Bob", "Carol", "Jack", "John"], starter, abilities)
-winner = game.run()
+print(f"\nWinner: {winner} in {game.turn_number} turns (seed {game.seed})")
 
-print("\n".join(game.log))
-print(f"\nWinner: {winner} in {game.turn_number} turns")
+if args.timing:
+    print(
+        f"Startup: {startup_ms:.1f} ms "
+        f"(catalog from {catalog.source} in {catalog.load_seconds * 1000:.1f} ms, "
+        f"pandas imported: {'yes' if 'pandas' in sys.modules else 'no'})",
+        file=sys.stderr,
+    )
@@ -0,0 +1,166 @@
+import random
+
+from effects import NUM_CARD_TYPES
+
+
+class CardPile:
+    """
+    A stack of cards backed by a single list; the top of the pile is the end.
+
+    Shuffling is lazy. `shuffle()` only moves the shuffle cursor: cards below
+    it are still in undecided order, and each draw that reaches the cursor
+    picks its card uniformly from them (one Fisher-Yates step). Only the cards
+    actually drawn get randomized, and the draw order has exactly the
+    distribution of an eager random.shuffle. Draws use `rng`, or the
+    `random` module when it is None; piles that are never shuffled hold no
+    rng, so they copy and pickle like plain lists.
+    """
+
+    __slots__ = ("_cards", "_unshuffled", "rng")
+
+    def __init__(self, cards=(), shuffled=False, rng=None):
+        self._cards = list(cards)
+        self._unshuffled = len(self._cards) if shuffled else 0
+        self.rng = rng
+
+    def __len__(self):
+        return len(self._cards)
+
+    def __bool__(self):
+        return bool(self._cards)
+
+    def __iter__(self):
+        return iter(self._cards)
+
+    def __contains__(self, card):
+        return card in self._cards
+
+    def __repr__(self):
+        return f"CardPile({len(self._cards)} cards, {self._unshuffled} unshuffled)"
+
+    def append(self, card):
+        self._cards.append(card)
+
+    def clear(self):
+        self._cards.clear()
+        self._unshuffled = 0
+
+    def shuffle(self):
+        self._unshuffled = len(self._cards)
+
+    def _settle_top(self, count):
+        # Fix the order of the top `count` cards with Fisher-Yates steps.
+        cards = self._cards
+        floor = len(cards) - count
+        u = self._unshuffled
+        rng = self.rng or random
+        while u > floor and u > 0:
+            if u > 1:
+                j = rng.randrange(u)
+                cards[j], cards[u - 1] = cards[u - 1], cards[j]
+            u -= 1
+        self._unshuffled = u
+
+    def pop(self):
+        """Removes and returns the top card."""
+        cards = self._cards
+        u = self._unshuffled
+        if u and u == len(cards):
+            if u > 1:
+                j = (self.rng or random).randrange(u)
+                cards[j], cards[-1] = cards[-1], cards[j]
+            self._unshuffled = u - 1
+        return cards.pop()
+
+    def top(self, count):
+        """Returns up to `count` top cards, bottom-most first."""
+        count = min(count, len(self._cards))
+        if count <= 0:
+            return []
+        self._settle_top(count)
+        return self._cards[-count:]
+
+    def replace_top(self, cards):
+        """Overwrites the top len(cards) cards, bottom-most first (see top())."""
+        if cards:
+            self._settle_top(len(cards))
+            self._cards[-len(cards):] = cards
+
+    def remove(self, card):
+        """Removes the first copy of `card`, keeping the other cards in order."""
+        cards = self._cards
+        index = cards.index(card)
+        del cards[index]
+        if index < self._unshuffled:
+            self._unshuffled -= 1
+
+    def take_all_from(self, other):
+        """
+        Moves every card of `other` onto this pile and shuffles lazily.
+        When this pile is empty the two piles just swap storage.
+        """
+        if self._cards:
+            self._cards.extend(other._cards)
+            other._cards.clear()
+        else:
+            self._cards, other._cards = other._cards, self._cards
+        other._unshuffled = 0
+        self.shuffle()
+
+
+class Hand:
+    """
+    A player's hand: cards in pickup order plus one bucket per card type.
+    Buckets keep hand order, so "first currency card", "all rockets" and
+    per-type counts read a bucket instead of scanning the whole hand.
+    """
+
+    __slots__ = ("_cards", "_by_type")
+
+    def __init__(self, cards=()):
+        self._cards = []
+        self._by_type = [[] for _ in range(NUM_CARD_TYPES)]
+        for card in cards:
+            self.append(card)
+
+    def __len__(self):
+        return len(self._cards)
+
+    def __bool__(self):
+        return bool(self._cards)
+
+    def __iter__(self):
+        return iter(self._cards)
+
+    def __contains__(self, card):
+        return card in self._by_type[card.type_code]
+
+    def __getitem__(self, index):
+        return self._cards[index]
+
+    def __repr__(self):
+        return f"Hand({[card.name for card in self._cards]})"
+
+    def append(self, card):
+        self._cards.append(card)
+        self._by_type[card.type_code].append(card)
+
+    def remove(self, card):
+        self._cards.remove(card)
+        self._by_type[card.type_code].remove(card)
+
+    def pop(self, index=-1):
+        card = self._cards.pop(index)
+        self._by_type[card.type_code].remove(card)
+        return card
+
+    def of_type(self, type_code):
+        """Cards of one type in hand order. Read-only view; don't mutate."""
+        return self._by_type[type_code]
+
+    def count(self, type_code):
+        return len(self._by_type[type_code])
+
+    def first(self, type_code):
+        bucket = self._by_type[type_code]
+        return bucket[0] if bucket else None
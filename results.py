@@ -0,0 +1,121 @@
+"""
+Columnar on-disk store of per-game simulation results.
+
+A store is a directory with one raw little-endian binary file per column
+plus columns.json (dtypes and row count). Rows are appended a chunk at a
+time, and open_results() maps every column read-only with np.memmap, so
+slicing millions of games touches only the columns and rows you use.
+"""
+
+import json
+import os
+
+import numpy as np
+
+from effects import TYPE_ROCKET, TYPE_SHIELD, TYPE_SPECIAL
+
+STORE_VERSION = 1
+META_FILE = "columns.json"
+
+COLUMNS = (
+    ("seed", "<u8"),
+    ("players", "u1"),
+    ("winner_seat", "i1"),       # -1 when the game ended in a Draw
+    ("turns", "<u2"),
+    ("draw", "u1"),              # 1 when the game ended in a Draw
+    ("ships_remaining", "<u2"),  # surviving ships over all fleets
+    ("bought_rocket", "<u2"),
+    ("bought_shield", "<u2"),
+    ("bought_special", "<u2"),
+    ("rockets_fired", "<u2"),
+)
+
+
+def new_chunk(size):
+    """Empty column arrays for `size` games."""
+    return {name: np.zeros(size, dtype=dtype) for name, dtype in COLUMNS}
+
+
+def record_game(chunk, row, game, winner):
+    """Fills row `row` of `chunk` from a finished game."""
+    winner_seat = -1
+    for player in game.players:
+        if player.name == winner:
+            winner_seat = player.seat
+    chunk["seed"][row] = game.seed
+    chunk["players"][row] = len(game.players)
+    chunk["winner_seat"][row] = winner_seat
+    chunk["turns"][row] = game.turn_number
+    chunk["draw"][row] = winner == "Draw"
+    chunk["ships_remaining"][row] = sum(p.ship_count for p in game.players)
+    chunk["bought_rocket"][row] = game.cards_bought[TYPE_ROCKET]
+    chunk["bought_shield"][row] = game.cards_bought[TYPE_SHIELD]
+    chunk["bought_special"][row] = game.cards_bought[TYPE_SPECIAL]
+    chunk["rockets_fired"][row] = game.rockets_fired
+
+
+def _column_path(directory, name):
+    return os.path.join(directory, f"{name}.bin")
+
+
+def _read_meta(directory):
+    try:
+        with open(os.path.join(directory, META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+    except FileNotFoundError:
+        return None
+    if meta.get("version") != STORE_VERSION or meta.get("columns") != [list(c) for c in COLUMNS]:
+        raise ValueError(f"{directory} is not a version {STORE_VERSION} results store with these columns")
+    return meta
+
+
+class ResultsWriter:
+    """Appends chunks to a store, creating it or extending an existing one."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        meta = _read_meta(directory)
+        self.rows = meta["rows"] if meta else 0
+        # Drop any partial tail left by an interrupted append.
+        for name, dtype in COLUMNS:
+            path = _column_path(directory, name)
+            with open(path, "ab") as f:
+                f.truncate(self.rows * np.dtype(dtype).itemsize)
+        self._write_meta()
+
+    def append(self, chunk, count=None):
+        """Appends the first `count` rows of `chunk` (all rows by default)."""
+        if count is None:
+            count = len(chunk["seed"])
+        if not count:
+            return
+        for name, _ in COLUMNS:
+            with open(_column_path(self.directory, name), "ab") as f:
+                f.write(chunk[name][:count].tobytes())
+        self.rows += count
+        self._write_meta()
+
+    def _write_meta(self):
+        # Written after the columns, so readers never see rows that aren't there.
+        meta = {"version": STORE_VERSION, "rows": self.rows, "columns": [list(c) for c in COLUMNS]}
+        path = os.path.join(self.directory, META_FILE)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, path)
+
+
+def open_results(directory):
+    """{column name: read-only np.memmap} for every column of a store."""
+    meta = _read_meta(directory)
+    if meta is None:
+        raise FileNotFoundError(os.path.join(directory, META_FILE))
+    rows = meta["rows"]
+    columns = {}
+    for name, dtype in COLUMNS:
+        if rows:
+            columns[name] = np.memmap(_column_path(directory, name), dtype=dtype, mode="r", shape=(rows,))
+        else:
+            columns[name] = np.zeros(0, dtype=dtype)
+    return columns
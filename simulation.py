@@ -1,34 +1,377 @@
-from collections import Counter
-from cards import load_all_decks
-from game import Game
+import hashlib
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import util
+from cards import DEFAULT_WORKBOOK, load_catalog
+from game import LOG_FULL, LOG_OFF, Game
+from logsink import ARCHIVE_SUFFIX, LogArchive
+from results import ResultsWriter, new_chunk, record_game
+from stats import SimulationStats
+from telemetry import EffectTelemetry
+from timing import PhaseTimes
+from trajectory import TrajectoryRecorder
 
 
-def run_simulation(num_games=1000, num_players=3, verbose=False):
-    starter, abilities = load_all_decks()
-    player_names = [f"Player_{i+1}" for i in range(num_players)]
+def game_seed(root_seed, game_index):
+    """
+    Seed of game `game_index` in a run started from `root_seed`.
+    Depends only on those two numbers, so any single game can be replayed.
+    """
+    digest = hashlib.blake2b(f"{root_seed}:{game_index}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
 
-    win_counts  = Counter()
-    turn_counts = []
 
-    for i in range(num_games):
-        game = Game(player_names, starter, abilities)
-        winner = game.run()
-        win_counts[winner] += 1
-        turn_counts.append(game.turn_number)
+class GameSeeds:
+    """Read-only sequence of a run's game seeds, computed on access."""
 
-        if verbose and i < 2:
-            print("\n".join(game.log))
+    __slots__ = ("root_seed", "num_games")
+
+    def __init__(self, root_seed, num_games):
+        self.root_seed = root_seed
+        self.num_games = num_games
+
+    def __len__(self):
+        return self.num_games
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.num_games))]
+        if index < 0:
+            index += self.num_games
+        if not 0 <= index < self.num_games:
+            raise IndexError(index)
+        return game_seed(self.root_seed, index)
+
+    def __iter__(self):
+        return (game_seed(self.root_seed, i) for i in range(self.num_games))
+
+
+def player_names_for(num_players):
+    return [f"Player_{i+1}" for i in range(num_players)]
+
+
+def replay_game(seed, num_players=3, catalog=None):
+    """Re-plays one game from its recorded seed and returns the finished Game."""
+    catalog = catalog or load_catalog()
+    game = Game(player_names_for(num_players), catalog.starter_deck, catalog.market_pile, seed=seed)
+    game.run()
+    return game
+
+
+# Open log archives of this process, by path: one per worker and log_dir.
+_archives = {}
+
+
+def _process_archive(log_dir):
+    path = os.path.join(log_dir, f"games-{os.getpid()}{ARCHIVE_SUFFIX}")
+    archive = _archives.get(path)
+    if archive is None:
+        os.makedirs(log_dir, exist_ok=True)
+        archive = _archives[path] = LogArchive(path)
+    return archive
+
+
+# Trajectory recorders of this process, by directory.
+_recorders = {}
+
+
+def _process_recorder(trajectory_dir):
+    recorder = _recorders.get(trajectory_dir)
+    if recorder is None:
+        recorder = _recorders[trajectory_dir] = TrajectoryRecorder(trajectory_dir)
+    return recorder
+
+
+def _close_process_sinks():
+    for archive in _archives.values():
+        archive.close()
+    _archives.clear()
+    for recorder in _recorders.values():
+        recorder.flush()
+    _recorders.clear()
+
+
+def play_games(catalog, num_players, root_seed, start, stop, log_dir=None, capture=None,
+               record=False, trajectory_dir=None, timing=False, telemetry=False):
+    """
+    Plays games start..stop-1 of the run seeded by `root_seed`.
+    Returns (SimulationStats, captures, results chunk, PhaseTimes,
+    EffectTelemetry); a pool worker's share.
+
+    With `log_dir`, every game's full log is streamed into this process's
+    archive there (see logsink.LogArchive), keyed by game seed. `capture`
+    (a capture.CapturePolicy) selects games whose traces are wanted; captures
+    lists their (game index, seed, reason) for replay. With `record`, the
+    chunk holds one results-store row per game (see results.py), else None.
+    With `trajectory_dir`, per-turn snapshots are written there as .npz
+    shards (see trajectory.py), flushed at the end of the call. With
+    `timing`, turn phases are timed into a timing.PhaseTimes, and with
+    `telemetry`, per-effect counters go into a telemetry.EffectTelemetry;
+    each is None when off.
+    """
+    player_names = player_names_for(num_players)
+    archive = _process_archive(log_dir) if log_dir else None
+    stats    = SimulationStats()
+    captures = []
+    chunk    = new_chunk(stop - start) if record else None
+    recorder = _process_recorder(trajectory_dir) if trajectory_dir else None
+    phase_times = PhaseTimes() if timing else None
+    effects  = EffectTelemetry() if telemetry else None
+    for i in range(start, stop):
+        this_seed = game_seed(root_seed, i)
+        if archive is None:
+            game = Game(
+                player_names, catalog.starter_deck, catalog.market_pile,
+                seed=this_seed, log_level=LOG_OFF, recorder=recorder, phase_times=phase_times,
+                telemetry=effects,
+            )
+            winner = game.run()
+        else:
+            game = Game(
+                player_names, catalog.starter_deck, catalog.market_pile,
+                seed=this_seed, log_level=LOG_FULL, keep_events=False, recorder=recorder,
+                phase_times=phase_times, telemetry=effects,
+            )
+            with archive.record(game, this_seed):
+                winner = game.run()
+        stats.add(winner, game.turn_number)
+        if chunk is not None:
+            record_game(chunk, i - start, game, winner)
+        if capture is not None and len(captures) != capture.limit:
+            reason = capture.reason(game, winner, this_seed)
+            if reason is not None:
+                captures.append((i, this_seed, reason))
+    if recorder is not None:
+        recorder.flush()
+    return stats, captures, chunk, phase_times, effects
+
+
+def _chunk_bounds(num_games, chunk_size):
+    return [(start, min(start + chunk_size, num_games)) for start in range(0, num_games, chunk_size)]
+
+
+def _merge_optional(total, part):
+    if part is None:
+        return total
+    return part if total is None else total.merge(part)
+
+
+def _merge_partials(partials, capture=None, results=None):
+    """
+    Folds play_games() results, in game order, into (stats, captures,
+    phase times, effect telemetry); the last two are None when off.
+    Results chunks are appended to the `results` ResultsWriter as they come.
+    """
+    stats       = SimulationStats()
+    captures    = []
+    phase_times = None
+    effects     = None
+    for part_stats, part_captures, part_chunk, part_times, part_effects in partials:
+        stats.merge(part_stats)
+        captures.extend(part_captures)
+        if part_chunk is not None:
+            results.append(part_chunk)
+        phase_times = _merge_optional(phase_times, part_times)
+        effects = _merge_optional(effects, part_effects)
+    if capture is not None and capture.limit is not None:
+        del captures[capture.limit:]
+    return stats, captures, phase_times, effects
+
+
+# Catalog of the current pool worker process, set once by _init_worker.
+_worker_catalog = None
+
+
+def _init_worker(catalog):
+    global _worker_catalog
+    _worker_catalog = catalog
+    # Workers exit through multiprocessing, which skips atexit but runs
+    # finalizers: close this worker's archives (and flush its trajectory
+    # recorders) when the pool shuts down.
+    util.Finalize(None, _close_process_sinks, exitpriority=10)
+
+
+def _worker_play_games(num_players, root_seed, start, stop, log_dir, capture, record, trajectory_dir,
+                       timing, telemetry):
+    return play_games(
+        _worker_catalog, num_players, root_seed, start, stop, log_dir, capture, record, trajectory_dir,
+        timing, telemetry,
+    )
+
+
+class SimulationPool:
+    """
+    Long-lived worker processes with the compiled card catalog preloaded.
+
+    The catalog reaches each worker once, through the pool initializer (and
+    is simply inherited under the fork start method). After that a batch
+    only ships (player count, root seed, game range), so many short runs can
+    go through the same warm pool with negligible dispatch overhead.
+    """
+
+    def __init__(self, workers, catalog=None, filepath=DEFAULT_WORKBOOK, mp_context=None):
+        self.catalog = catalog or load_catalog(filepath)
+        self.workers = workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(self.catalog,),
+        )
+
+    def play(self, num_players, root_seed, num_games, start=0, chunk_size=None, log_dir=None,
+             capture=None, results=None, trajectory_dir=None, timing=False, telemetry=False):
+        """
+        Plays games start..start+num_games-1 of the run seeded by `root_seed`.
+        Returns the merged (SimulationStats, captures in game order,
+        PhaseTimes if `timing`, EffectTelemetry if `telemetry`); rows go to
+        the `results` ResultsWriter, if given, as chunks complete.
+        """
+        if chunk_size is None:
+            chunk_size = max(1, min(2000, num_games // (self.workers * 8)))
+        bounds = _chunk_bounds(num_games, chunk_size)
+        partials = self._executor.map(
+            _worker_play_games,
+            [num_players] * len(bounds),
+            [root_seed] * len(bounds),
+            [start + lo for lo, _ in bounds],
+            [start + hi for _, hi in bounds],
+            [log_dir] * len(bounds),
+            [capture] * len(bounds),
+            [results is not None] * len(bounds),
+            [trajectory_dir] * len(bounds),
+            [timing] * len(bounds),
+            [telemetry] * len(bounds),
+        )
+        return _merge_partials(partials, capture, results)
+
+    def close(self):
+        """Stops the workers; each closes its log archives on the way out."""
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def run_simulation(num_games=1000, num_players=3, verbose=False, seed=None, workers=1,
+                   chunk_size=None, pool=None, log_dir=None, capture=None, results_dir=None,
+                   trajectory_dir=None, timing=False, telemetry=False):
+    """
+    workers > 1 splits the games across a process pool in chunks of
+    `chunk_size` games; pass `pool` (a SimulationPool) to reuse warm workers
+    across calls. Game seeds depend only on (root seed, game index), so
+    results for a given seed are the same for any worker count.
+
+    log_dir archives every game's full log, one compressed file per worker
+    process; logsink.find_archived_log(log_dir, seed) reads one back.
+
+    capture (a capture.CapturePolicy) keeps traces of selected games only:
+    games still run without logs, and the matches are replayed from their
+    seeds afterwards into result["captured"]. With verbose, those traces
+    are printed instead of the first two games.
+
+    results_dir appends one row per game to a columnar results store there
+    (see results.py); read it back with results.open_results(results_dir).
+
+    trajectory_dir records per-turn player snapshots of every game as .npz
+    shards there; trajectory.load_trajectories(trajectory_dir) reads them.
+
+    timing times every turn phase (draw, bank, debris, market, choose,
+    resolve) per action type and prints the table with the results; the
+    merged timing.PhaseTimes is returned as result["phase_times"].
+
+    telemetry counts, per card effect, plays chosen and resolved, shots
+    blocked and handler time, prints the table (plus the catalog's effects
+    that never resolved) and returns it as result["effect_telemetry"].
+    """
+    catalog = pool.catalog if pool is not None else load_catalog()
+    root_seed = random.getrandbits(64) if seed is None else seed
+    results = ResultsWriter(results_dir) if results_dir else None
+    options = {
+        "log_dir": log_dir, "capture": capture, "results": results,
+        "trajectory_dir": trajectory_dir, "timing": timing, "telemetry": telemetry,
+    }
+
+    if pool is not None:
+        stats, captures, phase_times, effects = pool.play(
+            num_players, root_seed, num_games, chunk_size=chunk_size, **options
+        )
+    elif workers > 1:
+        with SimulationPool(workers, catalog) as own_pool:
+            stats, captures, phase_times, effects = own_pool.play(
+                num_players, root_seed, num_games, chunk_size=chunk_size, **options
+            )
+    else:
+        partials = (
+            play_games(
+                catalog, num_players, root_seed, lo, hi, log_dir, capture, results is not None,
+                trajectory_dir, timing, telemetry,
+            )
+            for lo, hi in _chunk_bounds(num_games, chunk_size or 10000)
+        )
+        stats, captures, phase_times, effects = _merge_partials(partials, capture, results)
+        _close_process_sinks()
+
+    game_seeds = GameSeeds(root_seed, num_games)
+
+    captured = []
+    for i, this_seed, reason in captures:
+        game = replay_game(this_seed, num_players, catalog)
+        captured.append({"game_index": i, "seed": this_seed, "reason": reason, "log": game.log})
+
+    if verbose:
+        # Logs are not kept during the run; show the captured games, or
+        # replay the first two.
+        shown = captured if capture is not None else [
+            {"game_index": i, "seed": this_seed, "reason": None,
+             "log": replay_game(this_seed, num_players, catalog).log}
+            for i, this_seed in enumerate(game_seeds[:2])
+        ]
+        for entry in shown:
+            note = f", {entry['reason']}" if entry["reason"] else ""
+            print(f"[game {entry['game_index']}, seed {entry['seed']}{note}]")
+            print("\n".join(entry["log"]))
             print()
 
-    print(f"\n=== Simulation Results: {num_games} games, {num_players} players ===")
-    for name in sorted(win_counts):
-        pct = win_counts[name] / num_games * 100
-        print(f"  {name}: {win_counts[name]} wins ({pct:.1f}%)")
+    print(f"\n=== Simulation Results: {num_games} games, {num_players} players (seed {root_seed}) ===")
+    for name in sorted(stats.wins):
+        low, high = stats.win_interval(name)
+        print(
+            f"  {name}: {stats.wins[name]} wins ({stats.win_rate(name) * 100:.1f}%, "
+            f"95% CI {low * 100:.1f}-{high * 100:.1f}%)"
+        )
+
+    print(f"\n  Avg game length : {stats.mean_turns:.1f} turns (sd {stats.turns_stdev:.1f})")
+    print(
+        f"  p50 / p95 / p99 : {stats.turns_quantile(0.5)} / {stats.turns_quantile(0.95)} / "
+        f"{stats.turns_quantile(0.99)} turns"
+    )
+    print(f"  Shortest game   : {stats.min_turns} turns")
+    print(f"  Longest game    : {stats.max_turns} turns")
+
+    if phase_times is not None:
+        print("\n  Turn phases (mean us per turn, by action taken):")
+        for line in phase_times.summary_lines():
+            print(line)
+
+    if effects is not None:
+        print("\n  Card effects (hottest handlers first):")
+        for line in effects.summary_lines(card.effect_code for card in catalog.abilities):
+            print(line)
 
-    avg   = sum(turn_counts) / len(turn_counts)
-    print(f"\n  Avg game length : {avg:.1f} turns")
-    print(f"  Shortest game   : {min(turn_counts)} turns")
-    print(f"  Longest game    : {max(turn_counts)} turns")
+    return {
+        "root_seed": root_seed,
+        "stats": stats,
+        "win_counts": stats.wins,
+        "game_seeds": game_seeds,
+        "captured": captured,
+        "phase_times": phase_times,
+        "effect_telemetry": effects,
+    }
 
 
 if __name__ == "__main__":
@@ -0,0 +1,92 @@
+import math
+from collections import Counter
+
+
+def wilson_interval(successes, trials, z=1.96):
+    """Wilson score interval for a binomial proportion (95% by default)."""
+    if trials == 0:
+        return 0.0, 0.0
+    p = successes / trials
+    denom = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denom
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denom
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+class SimulationStats:
+    """
+    Running summary of simulated games in constant memory.
+
+    Game lengths are small integers (capped by max_turns), so they are kept
+    as an exact histogram: mean, variance and quantiles come out exact, not
+    approximated, and merging two accumulators is just adding counts. That
+    makes partial stats from workers or shards combine to exactly the result
+    of a single serial run.
+    """
+
+    __slots__ = ("games", "wins", "turn_histogram")
+
+    def __init__(self):
+        self.games = 0
+        self.wins = Counter()            # winner name (or "Draw") -> games
+        self.turn_histogram = Counter()  # game length in turns -> games
+
+    def add(self, winner, turns):
+        self.games += 1
+        self.wins[winner] += 1
+        self.turn_histogram[turns] += 1
+
+    def merge(self, other):
+        """Adds another accumulator's games into this one; returns self."""
+        self.games += other.games
+        self.wins.update(other.wins)
+        self.turn_histogram.update(other.turn_histogram)
+        return self
+
+    def win_rate(self, name):
+        return self.wins[name] / self.games if self.games else 0.0
+
+    def win_interval(self, name, z=1.96):
+        return wilson_interval(self.wins[name], self.games, z)
+
+    @property
+    def min_turns(self):
+        return min(self.turn_histogram) if self.turn_histogram else 0
+
+    @property
+    def max_turns(self):
+        return max(self.turn_histogram) if self.turn_histogram else 0
+
+    @property
+    def mean_turns(self):
+        if not self.games:
+            return 0.0
+        return sum(t * n for t, n in self.turn_histogram.items()) / self.games
+
+    @property
+    def turns_variance(self):
+        """Sample variance of game length, from exact integer sums."""
+        if self.games < 2:
+            return 0.0
+        total = sum(t * n for t, n in self.turn_histogram.items())
+        squares = sum(t * t * n for t, n in self.turn_histogram.items())
+        return (squares - total * total / self.games) / (self.games - 1)
+
+    @property
+    def turns_stdev(self):
+        return math.sqrt(self.turns_variance)
+
+    def turns_quantile(self, q):
+        """Nearest-rank quantile of game length, e.g. q=0.99 for p99."""
+        if not self.games:
+            return 0
+        rank = max(1, math.ceil(q * self.games))
+        seen = 0
+        for turns in sorted(self.turn_histogram):
+            seen += self.turn_histogram[turns]
+            if seen >= rank:
+                return turns
+        return self.max_turns
+
+    def __repr__(self):
+        return f"SimulationStats({self.games} games, mean {self.mean_turns:.1f} turns)"
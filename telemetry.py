@@ -0,0 +1,64 @@
+"""
+Per-effect telemetry.
+
+Game(telemetry=EffectTelemetry()) counts, for every effect code, how often
+a card with that effect was chosen, how often its handler resolved, how
+often its shots were blocked, and the handler time in nanoseconds. The
+counters are plain lists indexed by effect code, so they merge exactly
+across games and workers.
+"""
+
+from effects import EFFECT_NAMES, NUM_EFFECTS
+
+COUNTERS = ("chosen", "resolved", "blocked", "ns")
+
+
+class EffectTelemetry:
+    """
+    chosen    card picked as the turn's action (or deployed when bought)
+    resolved  handler ran: a card played, a reactive shield triggered
+    blocked   rocket shots that destroyed no ship (reactive shield,
+              assigned shield, starter side or last stand)
+    ns        time spent in the play handler, nested shots included
+    """
+
+    __slots__ = COUNTERS
+
+    def __init__(self):
+        for name in COUNTERS:
+            setattr(self, name, [0] * NUM_EFFECTS)
+
+    def merge(self, other):
+        """Adds another accumulator's counts into this one; returns self."""
+        for name in COUNTERS:
+            mine = getattr(self, name)
+            for code, value in enumerate(getattr(other, name)):
+                mine[code] += value
+        return self
+
+    def dead_effects(self, effects):
+        """Codes among `effects` (e.g. the catalog's) that never resolved."""
+        return sorted(code for code in set(effects) if not self.resolved[code])
+
+    def summary_lines(self, effects=()):
+        """
+        Table of every effect that was chosen or resolved, hottest handler
+        first; effects in `effects` that never resolved are listed after.
+        """
+        lines = [f"  {'effect':<40}{'chosen':>9}{'resolved':>10}{'blocked':>9}{'total ms':>10}{'us/play':>9}"]
+        codes = [code for code in range(NUM_EFFECTS) if self.chosen[code] or self.resolved[code]]
+        codes.sort(key=lambda code: self.ns[code], reverse=True)
+        for code in codes:
+            plays = self.chosen[code]
+            per_play = f"{self.ns[code] / plays / 1000:>9.2f}" if plays else f"{'-':>9}"
+            lines.append(
+                f"  {EFFECT_NAMES[code][:39]:<40}{self.chosen[code]:>9,}{self.resolved[code]:>10,}"
+                f"{self.blocked[code]:>9,}{self.ns[code] / 1e6:>10.1f}{per_play}"
+            )
+        dead = self.dead_effects(effects)
+        if dead:
+            lines.append(f"  Never resolved: {', '.join(EFFECT_NAMES[code] for code in dead)}")
+        return lines
+
+    def __repr__(self):
+        return f"EffectTelemetry({sum(self.resolved)} resolutions)"
@@ -0,0 +1,32 @@
+import unittest
+
+from capture import hit_turn_limit
+from cards import load_all_decks
+from game import Game
+
+
+class HitTurnLimitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.starter, cls.abilities = load_all_decks()
+
+    def _run(self, seed, max_turns):
+        game = Game(["a", "b", "c"], self.starter, self.abilities, seed=seed)
+        winner = game.run(max_turns=max_turns)
+        return game, winner
+
+    def test_cut_off_game_matches(self):
+        game, winner = self._run(3, 5)
+        self.assertEqual(game.turn_number, 5)
+        self.assertTrue(hit_turn_limit(game, winner))
+
+    def test_elimination_on_the_last_turn_does_not_match(self):
+        # Replays a game with the cap set to the turn it was decided on.
+        game, winner = self._run(3, 200)
+        self.assertFalse(hit_turn_limit(game, winner))
+        game, winner = self._run(3, game.turn_number)
+        self.assertFalse(hit_turn_limit(game, winner))
+
+
+if __name__ == "__main__":
+    unittest.main()
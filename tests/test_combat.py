@@ -0,0 +1,127 @@
+import random
+import unittest
+
+from cards import load_all_decks, load_catalog
+from combat import COMBAT_TABLE, HIT_ABSORBED, HIT_BLOCKED, HIT_DESTROYED, HIT_FLIPPED
+from effects import (
+    EFFECT_ASSIGN_BLOCK_2,
+    EFFECT_ASSIGN_BLOCK_ANY,
+    EFFECT_DESTROY_1_SHIP_IGNORE_SHIELDS,
+    EFFECT_DESTROY_1_UNSHIELDED_SHIP,
+    EFFECT_STRIP_ALL_SHIELDS_ONE_OPPONENT,
+    NUM_EFFECTS,
+    TYPE_SHIELD,
+)
+from game import STARTER_SHIP_SHIELDED_SIDE, STARTER_SHIP_UNSHIELDED_SIDE, Fleet, Game, Ship, _landing_ship
+
+# The landing and hit rules as RULES.md states them, read off the ship list
+# (the engine's old _choose_landing_ship / fire_rocket / hit estimate).
+
+
+def _shield_effect(ship):
+    return ship.shield.effect_code if ship.shield is not None else None
+
+
+def _first_weakest(ships):
+    low = min(ship.shield_hp for ship in ships)
+    return next(ship for ship in ships if ship.shield_hp == low)
+
+
+def _reference_landing(ships, effect):
+    shielded = [s for s in ships if s.shield is not None]
+    starter = [s for s in ships if s.is_on_starter_shielded_side()]
+    starter_bare = [s for s in starter if s.shield is None]
+    bare = [s for s in ships if s.shield is None and not s.is_on_starter_shielded_side()]
+    if effect == EFFECT_DESTROY_1_SHIP_IGNORE_SHIELDS:
+        block_any = [s for s in shielded if _shield_effect(s) == EFFECT_ASSIGN_BLOCK_ANY]
+        for ships_there in (block_any, starter_bare, starter, bare):
+            if ships_there:
+                return _first_weakest(ships_there) if ships_there is block_any else ships_there[0]
+        return _first_weakest(shielded) if shielded else ships[0]
+    if shielded:
+        return _first_weakest(shielded)
+    for ships_there in (starter_bare, bare):
+        if ships_there:
+            return ships_there[0]
+    return ships[0]
+
+
+def _reference_outcome(ship, effect):
+    if ship.shield is not None:
+        if effect == EFFECT_DESTROY_1_UNSHIELDED_SHIP:
+            return HIT_BLOCKED
+        if effect != EFFECT_DESTROY_1_SHIP_IGNORE_SHIELDS or _shield_effect(ship) == EFFECT_ASSIGN_BLOCK_ANY:
+            return HIT_ABSORBED
+    if ship.is_on_starter_shielded_side():
+        return HIT_FLIPPED
+    return HIT_DESTROYED
+
+
+def _reference_hit_value(ships, effect, last_stand):
+    if effect == EFFECT_STRIP_ALL_SHIELDS_ONE_OPPONENT:
+        shielded = sum(ship.shield is not None for ship in ships)
+        return shielded * 2.8 + (1.0 if shielded else 0.0)
+    ship = _reference_landing(ships, effect)
+    outcome = _reference_outcome(ship, effect)
+    if outcome == HIT_BLOCKED:
+        return 0.0
+    if outcome == HIT_ABSORBED:
+        return 1.8 + (1.0 if ship.shield_hp == 1 else 0.4)
+    if outcome == HIT_FLIPPED:
+        return 2.0
+    value = 6.0 + (7 - len(ships)) * 0.9
+    if len(ships) == 1:
+        value += 3.0
+        if last_stand:
+            value = 2.4
+    return value
+
+
+class CombatTableTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        catalog = load_catalog()
+        shields = {}
+        for card in catalog.abilities:
+            if card.type_code == TYPE_SHIELD:
+                shields.setdefault(card.effect_code, card)
+        cls.shields = [None] + list(shields.values())
+        starter, abilities = load_all_decks()
+        cls.game = Game(["a", "b"], starter, abilities, seed=1)
+
+    def _random_fleet(self, rng):
+        fleet = Fleet()
+        for _ in range(rng.randint(1, 6)):
+            ship = Ship(rng.choice((STARTER_SHIP_SHIELDED_SIDE, STARTER_SHIP_UNSHIELDED_SIDE)))
+            shield = rng.choice(self.shields)
+            if shield is not None:
+                ship.assign_shield(shield)
+            fleet.append(ship)
+            if shield is not None and shield.effect_code == EFFECT_ASSIGN_BLOCK_2 and rng.random() < 0.5:
+                ship.absorb_hit()
+        return fleet
+
+    def test_table_matches_the_rules_on_random_fleets(self):
+        rng = random.Random(0)
+        target = self.game.players[1]
+        for _ in range(3000):
+            fleet = self._random_fleet(rng)
+            ships = list(fleet)
+            target.fleet = fleet
+            target.last_stand = rng.random() < 0.3
+            for effect in range(NUM_EFFECTS):
+                with self.subTest(fleet=ships, effect=effect):
+                    self.assertEqual(
+                        self.game._compute_hit_value(target, effect),
+                        _reference_hit_value(ships, effect, target.last_stand),
+                    )
+                    if effect == EFFECT_STRIP_ALL_SHIELDS_ONE_OPPONENT:
+                        continue
+                    landing, outcome = COMBAT_TABLE[effect][fleet.composition]
+                    expected = _reference_landing(ships, effect)
+                    self.assertIs(_landing_ship(fleet, landing), expected)
+                    self.assertEqual(outcome, _reference_outcome(expected, effect))
+
+
+if __name__ == "__main__":
+    unittest.main()
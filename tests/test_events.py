@@ -0,0 +1,59 @@
+import json
+import pickle
+import subprocess
+import sys
+import unittest
+
+from cards import load_all_decks
+from events import EVENT_BUY, EventLog
+from game import LOG_FULL, Game
+
+# Unpickles an EventLog from stdin in a fresh process, whose object table
+# starts empty, and prints its rendered lines as JSON.
+_RENDER_ELSEWHERE = """
+import json, pickle, sys
+from events import render_event
+names, events = pickle.load(sys.stdin.buffer)
+print(json.dumps([render_event(event, names) for event in events]))
+"""
+
+
+class EventLogTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.starter, cls.abilities = load_all_decks()
+
+    def _game(self, num_players, seed):
+        game = Game([f"P{i}" for i in range(num_players)], self.starter, self.abilities,
+                    seed=seed, log_level=LOG_FULL)
+        emitted = []
+        game.subscribe(emitted.append)
+        game.run()
+        return game, emitted
+
+    def test_decodes_the_emitted_events(self):
+        for num_players in (2, 3, 4, 5):
+            for seed in range(5):
+                game, emitted = self._game(num_players, seed)
+                self.assertEqual(len(game.events), len(emitted))
+                self.assertEqual(list(game.events), emitted)
+
+    def test_pickle_round_trip_in_another_process(self):
+        game, _ = self._game(4, 7)
+        names = [p.name for p in game.players]
+        data = pickle.dumps((names, game.events))
+        result = subprocess.run(
+            [sys.executable, "-c", _RENDER_ELSEWHERE], input=data, capture_output=True, check=True
+        )
+        self.assertEqual(json.loads(result.stdout), game.log)
+
+    def test_rejects_more_than_seven_fields(self):
+        log = EventLog()
+        log.append((EVENT_BUY, 0, 1, 2, 3, 4, 5, 6))
+        with self.assertRaises(ValueError):
+            log.append((EVENT_BUY, 0, 1, 2, 3, 4, 5, 6, 7))
+        self.assertEqual(list(log), [(EVENT_BUY, 0, 1, 2, 3, 4, 5, 6)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,24 @@
+import copy
+import pickle
+import unittest
+
+from cards import load_all_decks
+from game import Game
+
+
+class GameCopyTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.starter, cls.abilities = load_all_decks()
+
+    def test_copies_replay_the_original(self):
+        game = Game(["a", "b", "c"], self.starter, self.abilities, seed=3)
+        copies = [copy.deepcopy(game), pickle.loads(pickle.dumps(game))]
+        winner = game.run()
+        for other in copies:
+            self.assertEqual(other.run(), winner)
+            self.assertEqual(other.turn_number, game.turn_number)
+
+
+if __name__ == "__main__":
+    unittest.main()
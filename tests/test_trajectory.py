@@ -0,0 +1,25 @@
+import tempfile
+import unittest
+
+from simulation import run_simulation
+from trajectory import load_trajectories
+
+
+class TrajectoryDirTest(unittest.TestCase):
+    def test_repeated_runs_append(self):
+        with tempfile.TemporaryDirectory() as directory:
+            run_simulation(num_games=20, num_players=3, seed=1, trajectory_dir=directory)
+            first_seeds, first = load_trajectories(directory)
+            run_simulation(num_games=20, num_players=3, seed=2, trajectory_dir=directory)
+            seeds, snapshots = load_trajectories(directory)
+
+        self.assertGreater(len(first), 0)
+        self.assertEqual(len(seeds), len(snapshots))
+        self.assertGreater(len(snapshots), len(first))
+        # The first run's rows are still there, ahead of the second run's.
+        self.assertTrue((seeds[:len(first_seeds)] == first_seeds).all())
+        self.assertTrue((snapshots[:len(first)] == first).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
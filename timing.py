@@ -0,0 +1,75 @@
+"""
+Per-phase turn timing.
+
+Game(phase_times=PhaseTimes()) times each phase of every turn with
+time.perf_counter_ns and adds it to a table of nanoseconds per (action,
+phase). Without one, games run the untimed play_turn and pay nothing.
+"""
+
+PHASES = ("draw", "bank", "debris", "market", "choose", "resolve")
+ACTIONS = ("buy", "rocket", "shield", "special", "pass")
+_ACTION_INDEX = {action: i for i, action in enumerate(ACTIONS)}
+
+
+class PhaseTimes:
+    """
+    Nanoseconds spent per phase, split by the action the turn took, and the
+    number of turns per action. Integer totals only, so accumulators from
+    separate games or workers merge exactly.
+    """
+
+    __slots__ = ("turns", "ns")
+
+    def __init__(self):
+        self.turns = [0] * len(ACTIONS)
+        self.ns = [[0] * len(PHASES) for _ in ACTIONS]
+
+    def add(self, action, durations):
+        """Adds one turn: `durations` are its phase times in PHASES order."""
+        i = _ACTION_INDEX[action]
+        self.turns[i] += 1
+        row = self.ns[i]
+        for phase, ns in enumerate(durations):
+            row[phase] += ns
+
+    def merge(self, other):
+        """Adds another accumulator's turns into this one; returns self."""
+        for i in range(len(ACTIONS)):
+            self.turns[i] += other.turns[i]
+            row = self.ns[i]
+            for phase, ns in enumerate(other.ns[i]):
+                row[phase] += ns
+        return self
+
+    @property
+    def total_turns(self):
+        return sum(self.turns)
+
+    def phase_totals(self):
+        """Nanoseconds per phase over all actions, in PHASES order."""
+        return [sum(row[phase] for row in self.ns) for phase in range(len(PHASES))]
+
+    def summary_lines(self):
+        """Table of mean microseconds per turn, one row per action taken."""
+        header = f"  {'action':<8}{'turns':>10}" + "".join(f"{p:>9}" for p in PHASES) + f"{'total':>9}"
+        lines = [header]
+        rows = [(action, self.turns[i], self.ns[i]) for i, action in enumerate(ACTIONS) if self.turns[i]]
+        rows.append(("all", self.total_turns, self.phase_totals()))
+        for action, turns, ns in rows:
+            if not turns:
+                continue
+            lines.append(
+                f"  {action:<8}{turns:>10,}"
+                + "".join(f"{t / turns / 1000:>9.2f}" for t in ns)
+                + f"{sum(ns) / turns / 1000:>9.2f}"
+            )
+        total = sum(self.phase_totals())
+        if total:
+            lines.append(
+                f"  {'share':<8}{'':>10}"
+                + "".join(f"{t / total * 100:>8.1f}%" for t in self.phase_totals())
+            )
+        return lines
+
+    def __repr__(self):
+        return f"PhaseTimes({self.total_turns} turns)"